@@ -16,9 +16,12 @@ pygame.display.init()
 pygame.display.set_mode((1600, 900))  # Set video mode before loading assets
 
 # Now import the menu and assets
-from game.menu import main_menu
+from game.menu import main_menu, run_scenes
 from game.game import Game
 from assets import outlines, arrows
+from Utility.gc_manager import gc_manager
 
 if __name__ == "__main__":
-    main_menu()
+    # Startup objects live for the whole session, keep them out of every collection
+    gc_manager.freeze_startup()
+    run_scenes(main_menu)
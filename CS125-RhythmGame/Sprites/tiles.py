@@ -3,11 +3,12 @@ from game.constants import WINDOW_HEIGHT
 
 
 class Tiles(pygame.sprite.Sprite):
-    def __init__(self, image, pos, key):
+    def __init__(self, image, pos, key, note_time=None):
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect(topleft=pos)
         self.key = key  # Store the key for hit detection
+        self.note_time = note_time  # Chart time at which the arrow reaches the hit zone
         
         # Create a hitbox that's slightly smaller than the arrow sprite
         hitbox_width = self.rect.width * 0.8  # 80% of sprite width
@@ -15,8 +16,9 @@ class Tiles(pygame.sprite.Sprite):
         self.hitbox = pygame.Rect(0, 0, hitbox_width, hitbox_height)
         self.hitbox.center = self.rect.center
 
-    def update(self, speed):
-        self.rect.y += speed
+    def update(self, song_time, hit_y, velocity):
+        # Center reaches hit_y exactly at note_time, moving velocity pixels per second
+        self.rect.centery = round(hit_y - (self.note_time - song_time) * velocity)
         self.hitbox.center = self.rect.center  # Update hitbox position with arrow
         if self.rect.y > WINDOW_HEIGHT:
             self.kill()
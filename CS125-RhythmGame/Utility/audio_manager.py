@@ -1,22 +1,51 @@
 import pygame
 import os
-import threading
-from queue import Queue
+import time
+from Utility.pcm_cache import PcmMusic
+from Utility.media_index import media_index
+
+# Drift beyond this (seconds) is corrected in one step instead of smoothed
+CLOCK_SNAP_THRESHOLD = 0.1
+# Fraction of the measured drift removed on each clock update
+CLOCK_SMOOTHING = 0.1
+
+# Decode songs once to a PCM cache and play them from a memory map instead of
+# streaming the MP3, for instant restarts and seeks to an exact sample frame.
+# The playback position is still estimated from the wall clock (see PcmMusic).
+PCM_CACHE_ENABLED = False
+
+# Mixer channels kept for hit sounds, the rest stay free for other sounds
+HIT_SOUND_CHANNELS = 6
+# Reserved channel for PCM cache music, right after the hit sound channels
+MUSIC_CHANNEL = HIT_SOUND_CHANNELS
+# Higher priority sounds may steal a channel from lower (or equal) priority ones
+SOUND_PRIORITY = {
+    'miss': 0,
+    'good': 1,
+    'perfect': 2
+}
 
 class AudioManager:
     def __init__(self):
         # Initialize pygame mixer with multiple channels
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
         pygame.mixer.set_num_channels(8)  # Allow multiple sounds to play simultaneously
-        
-        # Create a queue for sound effects
-        self.sound_queue = Queue()
+
+        # Reserve channels for hit sounds and PCM music so nothing else can take them
+        pygame.mixer.set_reserved(MUSIC_CHANNEL + 1)
+        self.hit_channels = [pygame.mixer.Channel(i) for i in range(HIT_SOUND_CHANNELS)]
+        # Priority and start order of the sound last played on each hit channel
+        self.channel_priority = [0] * HIT_SOUND_CHANNELS
+        self.channel_started = [0] * HIT_SOUND_CHANNELS
+        self.play_count = 0
         
         # Set default volumes
         self.sound_volume = 0.3  # 30% volume for sound effects
         self.music_volume = 0.3  # 30% volume for music (reverted to original)
+        self.music_start = 0.0  # Track position the current music was started from
+        self.pcm_music = PcmMusic(pygame.mixer.Channel(MUSIC_CHANNEL)) if PCM_CACHE_ENABLED else None
         
-        # Load sound effects
+        # Load sound effects, Sound decodes them to the mixer format up front
         self.sounds = {
             'perfect': self._load_sound('perfect.wav'),
             'good': self._load_sound('good.wav'),
@@ -27,12 +56,6 @@ class AudioManager:
         for sound in self.sounds.values():
             if sound:
                 sound.set_volume(self.sound_volume)
-        
-        # Start the sound effect thread
-        self.running = True
-        self.sound_thread = threading.Thread(target=self._process_sound_queue)
-        self.sound_thread.daemon = True
-        self.sound_thread.start()
     
     def _load_sound(self, filename):
         """Load a sound effect from the assets/sounds directory."""
@@ -45,48 +68,171 @@ class AudioManager:
             print(f"Error loading sound {filename}: {e}")
             return None
     
-    def _process_sound_queue(self):
-        """Process the sound effect queue in a separate thread."""
-        while self.running:
-            try:
-                sound_name = self.sound_queue.get(timeout=0.1)
-                if sound_name in self.sounds and self.sounds[sound_name]:
-                    self.sounds[sound_name].play()
-            except:
+    def _pick_channel(self, priority):
+        """Get a free hit channel, or steal the oldest lowest priority one."""
+        victim = None
+        for i, channel in enumerate(self.hit_channels):
+            if not channel.get_busy():
+                return i
+            if self.channel_priority[i] > priority:
                 continue
-    
+            if victim is None or (self.channel_priority[i], self.channel_started[i]) < (self.channel_priority[victim], self.channel_started[victim]):
+                victim = i
+        return victim
+
     def play_sound(self, sound_name):
-        """Add a sound to the queue to be played."""
-        if sound_name in self.sounds:
-            self.sound_queue.put(sound_name)
+        """Play a sound effect right away on one of the reserved hit channels."""
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            return
+        priority = SOUND_PRIORITY.get(sound_name, 0)
+        index = self._pick_channel(priority)
+        if index is None:
+            return  # Every channel is busy with a more important sound
+        self.play_count += 1
+        self.channel_priority[index] = priority
+        self.channel_started[index] = self.play_count
+        self.hit_channels[index].play(sound)
     
-    def play_music(self, music_path, volume=None):
-        """Play background music."""
+    def play_music(self, music_path, volume=None, start=0.0):
+        """Play background music, optionally from start seconds into the track."""
         try:
+            if start > 0:
+                length = self.get_music_length(music_path)
+                if length is not None and start >= length:
+                    print(f"[WARNING] Not resuming {music_path} at {start:.2f}s, past its end ({length:.2f}s)")
+                    return
+            if self.pcm_music:
+                self.pcm_music.load(music_path)
+                self.pcm_music.set_volume(volume if volume is not None else self.music_volume)
+                self.pcm_music.play(start)
+                return
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(volume if volume is not None else self.music_volume)
-            pygame.mixer.music.play()
+            pygame.mixer.music.play(start=start)
+            self.music_start = start
         except Exception as e:
             print(f"Error playing music: {e}")
+
+    def get_music_length(self, music_path):
+        """Get the length of a song in seconds from the media index, or None if it is unknown."""
+        try:
+            return media_index.audio_info(music_path)["duration"]
+        except Exception as e:
+            print(f"[WARNING] Could not read the length of {music_path}: {e}")
+            return None
+
+    def is_music_playing(self):
+        """Check whether music is playing (paused music does not count)."""
+        if self.pcm_music:
+            return self.pcm_music.get_busy()
+        return pygame.mixer.music.get_busy()
+
+    def get_music_position(self):
+        """Get the playback position of the music in seconds, or None if it is not playing."""
+        if not self.is_music_playing():
+            return None
+        if self.pcm_music:
+            return self.pcm_music.get_position()
+        # get_pos counts from the last play() call, not from the start of the track
+        pos = pygame.mixer.music.get_pos()
+        if pos < 0:
+            return None
+        return self.music_start + pos / 1000
     
     def stop_music(self):
         """Stop the background music."""
+        if self.pcm_music:
+            self.pcm_music.stop()
+            return
         pygame.mixer.music.stop()
     
     def pause_music(self):
         """Pause the background music."""
+        if self.pcm_music:
+            self.pcm_music.pause()
+            return
         pygame.mixer.music.pause()
     
     def unpause_music(self):
         """Unpause the background music."""
+        if self.pcm_music:
+            self.pcm_music.unpause()
+            return
         pygame.mixer.music.unpause()
     
     def cleanup(self):
         """Clean up resources."""
-        self.running = False
-        if self.sound_thread.is_alive():
-            self.sound_thread.join(timeout=1.0)
         pygame.mixer.quit()
 
+class SongClock:
+    """Master song time, driven by the wall clock and locked to the music.
+
+    Song time starts at zero when the clock is created. Once the music is
+    attached, every update compares the song time with the mixer's playback
+    position, smoothing small differences away and snapping on large ones.
+    Only streamed music reports real mixer progress. The PCM cache position
+    is wall-clock time since play() (see PcmMusic.get_position), so with it
+    the clock only lines up with when playback started and never corrects
+    drift.
+    """
+
+    def __init__(self, audio=None):
+        self.audio = audio
+        self.origin = time.perf_counter()
+        self.paused_at = None
+        self.music_offset = None  # Song time at which the track position is zero
+        self.drift = 0.0  # Last measured audio minus clock time, in seconds
+
+    def now(self):
+        """Get the current song time in seconds."""
+        if self.paused_at is not None:
+            return self.paused_at - self.origin
+        return time.perf_counter() - self.origin
+
+    def ticks_to_song_time(self, ticks):
+        """Convert a pygame tick count (e.g. an event timestamp) to song time."""
+        return self.now() - (pygame.time.get_ticks() - ticks) / 1000
+
+    def attach_music(self, music_offset):
+        """Follow the music, whose track position zero is at music_offset song time."""
+        self.music_offset = music_offset
+
+    def detach_music(self):
+        """Stop following the music and run on the wall clock only."""
+        self.music_offset = None
+
+    def music_position(self):
+        """Get the track position that matches the current song time."""
+        if self.music_offset is None:
+            return None
+        return self.now() - self.music_offset
+
+    def update(self):
+        """Correct drift between the song time and the music playback position."""
+        if self.audio is None or self.music_offset is None or self.paused_at is not None:
+            return
+        position = self.audio.get_music_position()
+        if position is None:
+            return
+        self.drift = self.music_offset + position - self.now()
+        if abs(self.drift) > CLOCK_SNAP_THRESHOLD:
+            self.origin -= self.drift
+        else:
+            self.origin -= self.drift * CLOCK_SMOOTHING
+
+    def seek(self, song_time):
+        """Jump the clock to song_time."""
+        self.origin += self.now() - song_time
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = time.perf_counter()
+
+    def resume(self):
+        if self.paused_at is not None:
+            self.origin += time.perf_counter() - self.paused_at
+            self.paused_at = None
+
 # Create a global instance
 audio_manager = AudioManager() 
\ No newline at end of file
@@ -1,11 +1,20 @@
 import pygame
 import os
+from collections import OrderedDict
+
+# Rendered text surfaces kept around, least recently used are dropped first
+TEXT_CACHE_SIZE = 256
+# Glyphs pre-rendered for composing numbers without rasterizing text
+ATLAS_CHARS = "0123456789-"
 
 class FontManager:
     def __init__(self):
         self.fonts = {}
         self.font_path = os.path.join('assets', 'fonts', 'Grand9k Pixel.ttf')
-        
+        self.text_cache = OrderedDict()
+        self.digit_atlases = {}
+        self.render_count = 0  # Calls into font.render, for checking the cache works
+
     def get_font(self, size):
         """Get a font object with the specified size."""
         if size not in self.fonts:
@@ -19,5 +28,62 @@ class FontManager:
                 self.fonts[size] = pygame.font.SysFont("arial", size)
         return self.fonts[size]
 
+    def _cached(self, key):
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+        return surface
+
+    def _store(self, key, surface):
+        self.text_cache[key] = surface
+        if len(self.text_cache) > TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surface
+
+    def render(self, font, text, color):
+        """Render antialiased text, reusing the surface if it was rendered before."""
+        key = (font, text, color)
+        surface = self._cached(key)
+        if surface is None:
+            self.render_count += 1
+            surface = self._store(key, font.render(text, True, color))
+        return surface
+
+    def _digit_atlas(self, font, color):
+        """Get the pre-rendered number glyphs for a font and color."""
+        key = (font, color)
+        if key not in self.digit_atlases:
+            self.render_count += len(ATLAS_CHARS)
+            self.digit_atlases[key] = {char: font.render(char, True, color) for char in ATLAS_CHARS}
+        return self.digit_atlases[key]
+
+    def render_number(self, font, value, color, prefix="", suffix=""):
+        """Render prefix + value + suffix, building the number from the digit atlas.
+
+        Only the prefix and suffix are ever rasterized (once each), so a new
+        score or combo value costs a few blits instead of a font render.
+        """
+        key = (font, value, color, prefix, suffix)
+        surface = self._cached(key)
+        if surface is not None:
+            return surface
+
+        atlas = self._digit_atlas(font, color)
+        pieces = [atlas[char] for char in str(value)]
+        if prefix:
+            pieces.insert(0, self.render(font, prefix, color))
+        if suffix:
+            pieces.append(self.render(font, suffix, color))
+
+        width = sum(piece.get_width() for piece in pieces)
+        height = max(piece.get_height() for piece in pieces)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for piece in pieces:
+            # Pieces never overlap, MAX copies their pixels and alpha as they are
+            surface.blit(piece, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += piece.get_width()
+        return self._store(key, surface)
+
 # Create a global font manager instance
-font_manager = FontManager() 
\ No newline at end of file
+font_manager = FontManager()
@@ -0,0 +1,75 @@
+import gc
+import time
+
+# Keep automatic garbage collection off while a song is playing
+GC_SUSPEND_DURING_SONGS = True
+# Explicit collections are logged when they take at least this long (ms)
+GC_LOG_MIN_PAUSE_MS = 1.0
+
+class GcManager:
+    """Keeps garbage collection pauses out of gameplay.
+
+    Everything alive after startup is frozen so collections never walk it
+    again. While a song plays, automatic collection is switched off, and
+    the game collects explicitly at quiet moments instead: the lead-in
+    before the music, the pause screen and scene changes. Every collection
+    is timed through gc.callbacks, so one that still happens mid-song shows
+    up in the log.
+    """
+
+    def __init__(self):
+        self.in_song = False
+        self.explicit = False  # Inside one of our own collections
+        self.started = 0.0
+        self.song_pauses = []  # (generation, ms) of automatic collections during the current song
+        self.last_pause_ms = 0.0
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter()
+            return
+        self.last_pause_ms = (time.perf_counter() - self.started) * 1000
+        if self.in_song and not self.explicit:
+            self.song_pauses.append((info["generation"], self.last_pause_ms))
+            print(f"[WARNING] Generation {info['generation']} collection during a song took {self.last_pause_ms:.2f} ms")
+
+    def freeze_startup(self):
+        """Collect once, then move every object alive after startup out of the collector's reach."""
+        self.collect("startup")
+        gc.freeze()
+
+    def collect(self, reason, generation=2):
+        """Run a collection now, at a moment where a pause is not noticed."""
+        self.explicit = True
+        try:
+            gc.collect(generation)
+        finally:
+            self.explicit = False
+        if self.last_pause_ms >= GC_LOG_MIN_PAUSE_MS:
+            print(f"[DEBUG] GC ({reason}) took {self.last_pause_ms:.2f} ms")
+
+    def begin_song(self):
+        """Collect before the music starts, then keep the collector quiet until end_song."""
+        # A restart ends the song that was playing
+        self.end_song()
+        self.collect("song start")
+        self.song_pauses = []
+        self.in_song = True
+        if GC_SUSPEND_DURING_SONGS:
+            gc.disable()
+
+    def end_song(self):
+        """Turn automatic collection back on and report any collection the song had."""
+        if not self.in_song:
+            return
+        self.in_song = False
+        gc.enable()
+        if self.song_pauses:
+            longest = max(ms for _, ms in self.song_pauses)
+            print(f"[WARNING] {len(self.song_pauses)} collections during the song, longest {longest:.2f} ms")
+        else:
+            print("[DEBUG] No garbage collections during the song")
+
+# Create a global GC manager instance
+gc_manager = GcManager()
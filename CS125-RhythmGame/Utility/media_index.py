@@ -0,0 +1,78 @@
+import json
+import os
+
+MEDIA_INDEX_PATH = os.path.join('cache', 'media_index.json')
+
+
+def _parse_video(path):
+    from pymediainfo import MediaInfo
+    info = MediaInfo.parse(path).video_tracks[0]
+    return {"frame rate": float(info.frame_rate),
+            # Some containers and streams don't report a frame count
+            "frame count": int(info.frame_count) if info.frame_count is not None else None,
+            "duration": info.duration / 1000,
+            "size": [info.width, info.height],
+            "aspect ratio": info.other_display_aspect_ratio[0]}
+
+
+def _parse_audio(path):
+    from pymediainfo import MediaInfo
+    info = MediaInfo.parse(path).audio_tracks[0]
+    return {"duration": info.duration / 1000,
+            "sample rate": int(info.sampling_rate),
+            "channels": int(info.channel_s)}
+
+
+class MediaIndex:
+    """Media metadata parsed once with MediaInfo and kept on disk between sessions.
+
+    Entries are keyed by path and re-parsed only when the file's mtime or
+    size changes. Video and audio details are filled in separately, the
+    first time each is asked for.
+    """
+
+    def __init__(self, path=MEDIA_INDEX_PATH):
+        self.path = path
+        self.entries = None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARNING] Could not save media index to {self.path}: {e}")
+
+    def _lookup(self, media_path, kind, parse):
+        if self.entries is None:
+            self._load()
+        stat = os.stat(media_path)
+        key = os.path.normpath(os.path.abspath(media_path))
+        entry = self.entries.get(key)
+        if not entry or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            self.entries[key] = entry
+        if kind not in entry:
+            entry[kind] = parse(media_path)
+            self._save()
+        return entry[kind]
+
+    def video_info(self, path):
+        """Get the frame rate, frame count (or None), duration (s), size and aspect ratio of a video."""
+        return self._lookup(path, 'video', _parse_video)
+
+    def audio_info(self, path):
+        """Get the duration (s), sample rate and channel count of an audio file."""
+        return self._lookup(path, 'audio', _parse_audio)
+
+# Create a global media index instance
+media_index = MediaIndex()
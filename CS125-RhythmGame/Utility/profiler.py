@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import threading
+import time
+
+# Where captures are written
+PROFILE_DIR = 'profiles'
+# Length of a capture started with the hotkey, in seconds
+PROFILE_SECONDS = 10.0
+# Time between stack samples, in seconds
+PROFILE_INTERVAL = 0.002
+# GIL switch interval during a capture, so the sampler gets in while the game is busy
+PROFILE_SWITCH_INTERVAL = 0.0001
+# Set to a number of seconds to capture the start of the first song, e.g. RHYTHM_PROFILE=15
+PROFILE_ENV = 'RHYTHM_PROFILE'
+
+class SamplingProfiler:
+    """Samples the game thread's call stack from a background thread.
+
+    A capture runs for a fixed number of seconds and then writes two files
+    to PROFILE_DIR: a collapsed-stack file (one "a;b;c count" line per
+    stack, for flamegraph.pl and similar tools) and a speedscope JSON file
+    with the samples in time order. No profiling code runs on the game
+    thread itself.
+    """
+
+    def __init__(self):
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.env_seconds = None
+        value = os.environ.get(PROFILE_ENV)
+        if value:
+            try:
+                self.env_seconds = float(value)
+            except ValueError:
+                print(f"[WARNING] Ignoring {PROFILE_ENV}={value!r}, expected a number of seconds")
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, tag, seconds=PROFILE_SECONDS):
+        """Capture the calling thread for the next seconds, unless a capture is already running."""
+        if self.is_running():
+            print("[WARNING] A profile capture is already running")
+            return False
+        self.stop_event.clear()
+        target = threading.get_ident()
+        self.thread = threading.Thread(target=self._capture, args=(target, tag, seconds), daemon=True)
+        self.thread.start()
+        print(f"[DEBUG] Profiling {tag} for {seconds:g}s")
+        return True
+
+    def start_from_env(self, tag):
+        """Start the capture requested with PROFILE_ENV, once per run."""
+        if self.env_seconds is None:
+            return False
+        seconds, self.env_seconds = self.env_seconds, None
+        return self.start(tag, seconds)
+
+    def stop(self):
+        """End the running capture early, it is still written out."""
+        self.stop_event.set()
+        if self.is_running():
+            self.thread.join()
+
+    def _capture(self, target, tag, seconds):
+        stacks = {}  # Stack tuple -> id
+        samples = []  # Stack id per sample, in time order
+        # The game thread only hands over the GIL every switch interval (5 ms by
+        # default), which would hide most of a frame's work from the sampler
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(PROFILE_SWITCH_INTERVAL)
+        started = time.perf_counter()
+        end = started + seconds
+        try:
+            while time.perf_counter() < end and not self.stop_event.wait(PROFILE_INTERVAL):
+                frame = sys._current_frames().get(target)
+                if frame is None:
+                    break  # The sampled thread is gone
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                    frame = frame.f_back
+                stack = tuple(reversed(stack))
+                samples.append(stacks.setdefault(stack, len(stacks)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self._write(tag, stacks, samples, time.perf_counter() - started)
+
+    def _write(self, tag, stacks, samples, elapsed):
+        if not samples:
+            print("[WARNING] Profile capture took no samples")
+            return None
+        name = f"{tag}_{time.strftime('%Y%m%d-%H%M%S')}"
+        base = os.path.join(PROFILE_DIR, name)
+        by_id = sorted(stacks, key=stacks.get)
+        counts = [0] * len(by_id)
+        for stack_id in samples:
+            counts[stack_id] += 1
+
+        # Frames shared by every stack, for speedscope
+        frames = {}
+        for stack in by_id:
+            for frame in stack:
+                frames.setdefault(frame, len(frames))
+        weight = elapsed * 1000 / len(samples)
+
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            with open(base + '.collapsed', 'w') as f:
+                for stack, count in zip(by_id, counts):
+                    f.write(';'.join(self._label(frame) for frame in stack) + f" {count}\n")
+            with open(base + '.speedscope.json', 'w') as f:
+                json.dump({
+                    "$schema": "https://www.speedscope.app/file-format-schema.json",
+                    "name": name,
+                    "exporter": "CS125-RhythmGame sampling profiler",
+                    "shared": {"frames": [{"name": func, "file": path, "line": line}
+                                          for func, path, line in frames]},
+                    "profiles": [{
+                        "type": "sampled",
+                        "name": name,
+                        "unit": "milliseconds",
+                        "startValue": 0,
+                        "endValue": weight * len(samples),
+                        "samples": [[frames[frame] for frame in by_id[stack_id]] for stack_id in samples],
+                        "weights": [weight] * len(samples)
+                    }]
+                }, f)
+        except OSError as e:
+            print(f"[WARNING] Could not write profile to {PROFILE_DIR}: {e}")
+            return None
+        print(f"[DEBUG] Profile of {len(samples)} samples over {elapsed:.1f}s written to {base}.collapsed and .speedscope.json")
+        return base
+
+    @staticmethod
+    def _label(frame):
+        func, path, line = frame
+        return f"{func} ({os.path.basename(path)}:{line})"
+
+# Create a global profiler instance
+profiler = SamplingProfiler()
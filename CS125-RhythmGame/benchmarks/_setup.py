@@ -0,0 +1,19 @@
+"""Common setup for the scripts in benchmarks/ and tools/.
+
+Import it before pygame or any game module. It:
+- selects the SDL dummy video and audio drivers, unless others are set;
+- remembers the directory the script was started from as START_DIR, for
+  paths given on the command line;
+- changes to the project root, ROOT, which the asset paths are relative to;
+- puts ROOT on sys.path so the game and Utility packages import.
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+START_DIR = os.getcwd()
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
@@ -0,0 +1,247 @@
+"""Headless gameplay benchmark on synthetic charts.
+
+Generates charts from 2 to 50 notes per second spread over the 4 lanes
+and plays each one through Game with the SDL dummy drivers. A bot presses
+every note on time. The song clock is stepped one frame per iteration,
+so every run draws the same frames no matter how fast the machine is.
+
+For each chart it reports:
+- frame time percentiles for events + update + draw + present;
+- notes judged per second of song time, and whether the frame budget
+  (1000 / FPS ms) held at p99;
+- allocations per frame, from a second, shorter pass under tracemalloc:
+  the peak bytes a frame allocates on top of what was live when it started,
+  and the net change in allocated memory blocks.
+
+Results are printed as a table and can be written to JSON with --json.
+--compare takes an earlier JSON file and shows the p50/p99 change per
+chart, to spot regressions between commits.
+
+Usage: python benchmarks/gameplay.py [--rates 2,5,10] [--seconds 20] [--json out.json] [--compare base.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import _setup
+
+import pygame
+
+from game.constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT, MUSIC_START_DELAY, LANE_KEYS
+
+pygame.init()
+pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+from game.game import Game, KEY_BINDINGS
+from assets import outlines, arrows
+
+DEFAULT_RATES = (2, 5, 10, 20, 35, 50)
+# Frames at the start of each run left out of the statistics (first text renders, caches)
+WARMUP_FRAMES = 30
+# Frames measured under tracemalloc, which is too slow for the timing pass
+ALLOC_FRAMES = 300
+# Shortest gap between two notes on the same lane, the hit detector ignores faster presses
+SAME_LANE_GAP = 0.06
+MUSIC_FILE = os.path.join('assets', 'songs', 'Song 1', 'audio', 'song1.mp3')
+LANE_PRESS_KEYS = {key: code for code, key in KEY_BINDINGS.items()}
+
+
+def write_chart(path, rate, seconds, seed=0):
+    """Write a key log with rate notes per second, each on a random lane.
+
+    A lane is not reused within SAME_LANE_GAP, so every note can be hit.
+    """
+    rng = random.Random(seed)
+    start = MUSIC_START_DELAY + 1.0
+    last_used = dict.fromkeys(LANE_KEYS, float('-inf'))
+    with open(path, 'w') as f:
+        f.write("timestamp,key\n")
+        for i in range(int(rate * seconds)):
+            timestamp = start + i / rate
+            free = [key for key in LANE_KEYS if timestamp - last_used[key] >= SAME_LANE_GAP]
+            key = rng.choice(free or LANE_KEYS)
+            last_used[key] = timestamp
+            f.write(f"{timestamp:.4f},{key}\n")
+
+
+def press_due_notes(g):
+    """Press every lane whose next note is due this frame, like a perfect player."""
+    now = g.clock.now()
+    for key, lane in g.hit_detector.lanes.items():
+        if lane and lane[0][0] <= now + 0.008:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=LANE_PRESS_KEYS[key]))
+
+
+def play(chart_path, seconds, difficulty, frames=None, on_frame=None):
+    """Play a chart frame by frame.
+
+    Returns the frame times in ms, the number of notes hit and the misses.
+    """
+    songs = {'bench': {'music_file': MUSIC_FILE, 'key_log_file': chart_path}}
+    g = Game(outlines, arrows, songs, 'bench', difficulty)
+    # The hit detector only keeps a combo, so count the hits on the way through
+    hits = 0
+    handle_hit = g.hit_detector._handle_hit
+
+    def counting_handle_hit(*args):
+        nonlocal hits
+        hits += 1
+        return handle_hit(*args)
+
+    g.hit_detector._handle_hit = counting_handle_hit
+    if frames is None:
+        frames = int((seconds + 2.0) * FPS)
+    start_time = MUSIC_START_DELAY
+    samples = []
+    try:
+        for i in range(frames):
+            g.clock.seek(start_time + i / FPS)
+            press_due_notes(g)
+            if on_frame:
+                on_frame(True)
+            start = time.perf_counter()
+            g.handle_events()
+            g.update()
+            g.draw()
+            g.present()
+            elapsed = time.perf_counter() - start
+            if on_frame:
+                on_frame(False)
+            samples.append(elapsed * 1000)
+            # Keep the clock on the stepped time instead of the music
+            g.clock.detach_music()
+        return samples, hits, g.hit_detector.misses
+    finally:
+        g.cleanup()
+
+
+def measure_allocations(chart_path, seconds, difficulty):
+    """Get the mean peak bytes allocated per frame and net blocks per frame."""
+    peaks = []
+    blocks = []
+    state = {}
+
+    def on_frame(starting):
+        if starting:
+            tracemalloc.reset_peak()
+            state['current'] = tracemalloc.get_traced_memory()[0]
+            state['blocks'] = sys.getallocatedblocks()
+        else:
+            peaks.append(tracemalloc.get_traced_memory()[1] - state['current'])
+            blocks.append(sys.getallocatedblocks() - state['blocks'])
+
+    tracemalloc.start()
+    try:
+        play(chart_path, seconds, difficulty, WARMUP_FRAMES + ALLOC_FRAMES, on_frame)
+    finally:
+        tracemalloc.stop()
+    peaks = peaks[WARMUP_FRAMES:]
+    blocks = blocks[WARMUP_FRAMES:]
+    return statistics.mean(peaks), statistics.mean(blocks)
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    return {'p50': pick(0.5), 'p90': pick(0.9), 'p99': pick(0.99), 'max': ordered[-1],
+            'mean': statistics.mean(ordered)}
+
+
+def run_rate(rate, seconds, difficulty, directory):
+    chart_path = os.path.join(directory, f'chart_{rate}.csv')
+    write_chart(chart_path, rate, seconds)
+    samples, hits, misses = play(chart_path, seconds, difficulty)
+    frame_ms = percentiles(samples[WARMUP_FRAMES:])
+    alloc_peak, net_blocks = measure_allocations(chart_path, seconds, difficulty)
+    return {
+        'rate': rate,
+        'notes': int(rate * seconds),
+        'frames': len(samples) - WARMUP_FRAMES,
+        'frame_ms': frame_ms,
+        'within_budget': frame_ms['p99'] <= 1000 / FPS,
+        'notes_per_second': (hits + misses) / seconds,
+        'hits': hits,
+        'misses': misses,
+        'alloc_peak_bytes_per_frame': alloc_peak,
+        'net_blocks_per_frame': net_blocks
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results, baseline=None):
+    base = {entry['rate']: entry for entry in baseline['results']} if baseline else {}
+    print(f"{'notes/s':>7s} {'p50 ms':>8s} {'p90 ms':>8s} {'p99 ms':>8s} {'max ms':>8s} {'judged/s':>8s} "
+          f"{'misses':>6s} {'alloc KB/f':>10s} {'blocks/f':>8s}" + ("  p50/p99 vs base" if base else ""))
+    for entry in results:
+        ms = entry['frame_ms']
+        line = (f"{entry['rate']:7d} {ms['p50']:8.3f} {ms['p90']:8.3f} {ms['p99']:8.3f} {ms['max']:8.3f} "
+                f"{entry['notes_per_second']:8.1f} {entry['misses']:6d} "
+                f"{entry['alloc_peak_bytes_per_frame'] / 1024:10.1f} {entry['net_blocks_per_frame']:8.1f}")
+        old = base.get(entry['rate'])
+        if old:
+            p50 = (ms['p50'] / old['frame_ms']['p50'] - 1) * 100
+            p99 = (ms['p99'] / old['frame_ms']['p99'] - 1) * 100
+            line += f"  {p50:+6.1f}% / {p99:+6.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rates', default=','.join(str(rate) for rate in DEFAULT_RATES),
+                        help="comma separated notes per second (default: %(default)s)")
+    parser.add_argument('--seconds', type=float, default=20.0, help="chart length (default: %(default)s)")
+    parser.add_argument('--difficulty', default='easy', help="game difficulty (default: %(default)s)")
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--compare', help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    rates = [int(rate) for rate in args.rates.split(',')]
+    with tempfile.TemporaryDirectory() as directory:
+        results = [run_rate(rate, args.seconds, args.difficulty, directory) for rate in rates]
+
+    sustained = [entry['rate'] for entry in results if entry['within_budget'] and entry['misses'] == 0]
+    report = {
+        'benchmark': 'gameplay',
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'fps': FPS,
+        'seconds': args.seconds,
+        'difficulty': args.difficulty,
+        'max_sustained_rate': max(sustained) if sustained else None,
+        'results': results
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+    print(f"Highest rate held within {1000 / FPS:.1f} ms at p99 with no misses: {report['max_sustained_rate']} notes/s")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
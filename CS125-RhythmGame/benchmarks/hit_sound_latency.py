@@ -0,0 +1,75 @@
+"""Press-to-sound dispatch latency: old queue/thread path versus direct channel playback.
+
+Latency is measured from the play request until the mixer reports the
+sound as playing, which is the part of the path the game controls. The
+audio device's own output buffer comes on top of both numbers.
+
+Usage: python benchmarks/hit_sound_latency.py [trials]
+"""
+import statistics
+import sys
+import threading
+import time
+from queue import Queue
+
+import _setup
+
+import pygame
+
+from Utility.audio_manager import audio_manager
+
+
+class ThreadedSoundPlayer:
+    """The previous implementation: a daemon thread polling a queue."""
+
+    def __init__(self, sounds):
+        self.sounds = sounds
+        self.sound_queue = Queue()
+        self.running = True
+        self.thread = threading.Thread(target=self._process_sound_queue, daemon=True)
+        self.thread.start()
+
+    def _process_sound_queue(self):
+        while self.running:
+            try:
+                sound_name = self.sound_queue.get(timeout=0.1)
+                if sound_name in self.sounds and self.sounds[sound_name]:
+                    self.sounds[sound_name].play()
+            except:
+                continue
+
+    def play_sound(self, sound_name):
+        self.sound_queue.put(sound_name)
+
+
+def measure(play_sound, trials):
+    samples = []
+    for i in range(trials):
+        pygame.mixer.stop()
+        start = time.perf_counter()
+        play_sound('perfect' if i % 2 else 'good')
+        while not pygame.mixer.get_busy():
+            if time.perf_counter() - start > 1.0:
+                break
+        samples.append((time.perf_counter() - start) * 1000)
+        # Keep some game-thread work going, like a real frame would
+        sum(range(20000))
+    return samples
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:22s} median {statistics.median(samples):7.3f} ms  p99 {p99:7.3f} ms  max {samples[-1]:7.3f} ms")
+
+
+def main():
+    trials = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    threaded = ThreadedSoundPlayer(audio_manager.sounds)
+    report("queue + thread (old)", measure(threaded.play_sound, trials))
+    threaded.running = False
+    report("reserved channels", measure(audio_manager.play_sound, trials))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""CPU used by a menu sitting idle, busy-looping versus waiting for input.
+
+Runs the main menu for a few seconds with nobody touching it, first as the
+old loop (buttons rebuilt and the screen redrawn as fast as possible), then
+the real main_menu(), which sleeps until there is input. A timer posts QUIT
+to end main_menu(). Reports CPU time as a share of wall time and the frames
+drawn per second.
+
+Usage: python benchmarks/menu_idle_cpu.py [seconds]
+"""
+import sys
+import time
+
+import _setup
+
+import pygame
+
+from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+pygame.init()
+pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+import game.menu as menu
+from Utility.font_manager import font_manager
+
+
+def busy_main_menu(seconds):
+    """The main menu loop as it was: rebuild and redraw everything, never sleep."""
+    frames = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        mouse_pos = pygame.mouse.get_pos()
+        menu.SCREEN.fill(menu.COLORS["BLACK"])
+        menu_text = font_manager.get_font(100).render("RHYTHM GAME", True, menu.COLORS["GOLD"])
+        menu.SCREEN.blit(menu_text, menu_text.get_rect(center=(menu.SCREEN_WIDTH//2, 200)))
+        for i, label in enumerate(["PLAY", "ENDLESS", "QUIT"]):
+            button = menu.Button(image=None, pos=(menu.SCREEN_WIDTH//2, 350 + i * 130), text_input=label,
+                                 font_size=75, base_color=menu.COLORS["WHITE"],
+                                 hovering_color=menu.COLORS["RED"], width=400, height=95)
+            button.changeColor(mouse_pos)
+            button.update(menu.SCREEN)
+        pygame.event.get()
+        pygame.display.update()
+        frames += 1
+    return frames
+
+
+def event_main_menu(seconds):
+    """The real main menu, stopped by a QUIT event after the given time."""
+    frames = 0
+    update = pygame.display.update
+
+    def counting_update(*args):
+        nonlocal frames
+        frames += 1
+        return update(*args)
+
+    pygame.display.update = counting_update
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+    try:
+        menu.main_menu()
+    except SystemExit:
+        pass
+    finally:
+        pygame.display.update = update
+    return frames
+
+
+def measure(name, loop, seconds):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    frames = loop(seconds)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    print(f"{name:14s} CPU {cpu / wall * 100:5.1f}% of a core  {frames / wall:7.1f} frames/s")
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    measure("busy loop", busy_main_menu, seconds)
+    # main_menu() calls pygame.quit() on QUIT, so it has to go last
+    measure("event-driven", event_main_menu, seconds)
+
+
+if __name__ == "__main__":
+    main()
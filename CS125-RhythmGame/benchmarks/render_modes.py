@@ -0,0 +1,88 @@
+"""Frame draw + present cost: full-window redraws versus dirty rects.
+
+Plays the first song without a background video, stepping the song clock
+by one frame each iteration so both modes draw exactly the same frames.
+Besides the time per frame it reports how many pixels are pushed to the
+window, which is what a real display driver pays for on every update
+(the dummy driver used by default does not show that cost).
+
+Usage: python benchmarks/render_modes.py [frames] [difficulty]
+"""
+import os
+import statistics
+import sys
+import time
+
+import _setup
+
+import pygame
+
+from game.constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT, MUSIC_START_DELAY
+
+pygame.init()
+pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+import game.game
+from assets import outlines, arrows
+
+SONGS = {
+    'song1': {
+        'music_file': os.path.join('assets', 'songs', 'Song 1', 'audio', 'song1.mp3'),
+        'key_log_file': os.path.join('assets', 'songs', 'Song 1', 'key_log.csv')
+    }
+}
+
+
+def measure(mode, frames, difficulty):
+    game.game.RENDER_MODE = mode
+    g = game.game.Game(outlines, arrows, SONGS, 'song1', difficulty)
+    # Benchmark the note-drawing path, not the video
+    if g.background_video:
+        g.background_video.close()
+        g.background_video = None
+
+    # Count the pixels each update pushes
+    pushed = []
+    update = pygame.display.update
+
+    def counting_update(rects=None):
+        if rects is None:
+            pushed.append(WINDOW_WIDTH * WINDOW_HEIGHT)
+        else:
+            pushed.append(sum(pygame.Rect(rect).w * pygame.Rect(rect).h for rect in rects))
+        return update(rects) if rects is not None else update()
+
+    pygame.display.update = counting_update
+    samples = []
+    try:
+        for i in range(frames):
+            g.clock.seek(MUSIC_START_DELAY + 2.0 + i / FPS)
+            g.update()
+            # Keep the clock on the stepped time instead of the music
+            g.clock.detach_music()
+            start = time.perf_counter()
+            g.draw()
+            g.present()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        pygame.display.update = update
+        g.cleanup()
+    return samples, pushed
+
+
+def report(name, samples, pushed):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:12s} median {statistics.median(samples):7.3f} ms  p99 {p99:7.3f} ms  "
+          f"pixels pushed/frame {statistics.mean(pushed) / 1e3:8.1f}k")
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    difficulty = sys.argv[2] if len(sys.argv) > 2 else 'hard'
+    report("full", *measure("full", frames, difficulty))
+    report("dirty rects", *measure("dirty", frames, difficulty))
+
+
+if __name__ == "__main__":
+    main()
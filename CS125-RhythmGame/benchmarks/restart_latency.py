@@ -0,0 +1,79 @@
+"""Restart-to-first-frame latency: rebuilding the Game versus Game.reset().
+
+Cold is what RESTART used to do: clean up the game, wait 100 ms, build a
+new Game (chart, video, surfaces) and draw its first frame. Warm rewinds
+the same Game with reset() and draws its first frame. Put a video at
+assets/vids/song1.mp4 to include the video in both paths.
+
+Usage: python benchmarks/restart_latency.py [restarts] [difficulty]
+"""
+import os
+import statistics
+import sys
+import time
+
+import _setup
+
+import pygame
+
+from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+pygame.init()
+pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+from game.game import Game
+from assets import outlines, arrows
+
+SONGS = {
+    'song1': {
+        'music_file': os.path.join('assets', 'songs', 'Song 1', 'audio', 'song1.mp3'),
+        'key_log_file': os.path.join('assets', 'songs', 'Song 1', 'key_log.csv')
+    }
+}
+
+
+def first_frame(g):
+    g.update()
+    g.draw()
+    g.present()
+
+
+def cold(restarts, difficulty):
+    samples = []
+    g = Game(outlines, arrows, SONGS, 'song1', difficulty)
+    for _ in range(restarts):
+        start = time.perf_counter()
+        g.cleanup()
+        pygame.time.wait(100)
+        g = Game(outlines, arrows, SONGS, 'song1', difficulty)
+        first_frame(g)
+        samples.append((time.perf_counter() - start) * 1000)
+    g.cleanup()
+    return samples
+
+
+def warm(restarts, difficulty):
+    samples = []
+    g = Game(outlines, arrows, SONGS, 'song1', difficulty)
+    for _ in range(restarts):
+        start = time.perf_counter()
+        g.reset()
+        first_frame(g)
+        samples.append((time.perf_counter() - start) * 1000)
+    g.cleanup()
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:12s} median {statistics.median(samples):8.2f} ms  max {max(samples):8.2f} ms")
+
+
+def main():
+    restarts = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    difficulty = sys.argv[2] if len(sys.argv) > 2 else 'hard'
+    report("cold", cold(restarts, difficulty))
+    report("warm reset", warm(restarts, difficulty))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Soak check: memory and stack depth across hundreds of game restarts.
+
+Starts the first song through the scene loop and plays it over and over.
+Each run plays a few frames and then leaves the game one of two ways:
+- RESTART, as on the pause or results popup, which rewinds the same Game
+  with Game.reset();
+- QUIT to the main menu every few runs, which tears the Game down. The
+  main menu is replaced by a stand-in that picks the song again, so the
+  next run builds a new Game through start_game.
+After the last run the stand-in ends the scene loop.
+
+Every report line shows the process RSS, the Game objects created and
+still alive, and the Python stack depth inside the running game. RSS,
+live games (at most the one running) and stack depth should stay flat
+while games created keeps growing.
+
+Usage: python benchmarks/restart_soak.py [runs] [frames per run] [restarts per game]
+"""
+import gc
+import os
+import sys
+import traceback
+import weakref
+
+import _setup
+
+import pygame
+
+from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+pygame.init()
+pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+import game.menu as menu
+from game.game import Game
+
+REPORT_EVERY = 50
+
+
+def rss_mb():
+    """Resident set size of this process in MB (Linux only)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return float('nan')
+
+
+def main():
+    total_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    restarts_per_game = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    games = weakref.WeakSet()
+    created = 0
+    runs = 0
+
+    def short_run(self):
+        """Play a few frames, then restart or quit to the menu like the popup buttons do."""
+        nonlocal runs, created
+        if self not in games:
+            created += 1
+            games.add(self)
+        for _ in range(frames):
+            self.handle_events()
+            self.update()
+            self.draw()
+            self.present()
+        if runs % REPORT_EVERY == 0:
+            print(f"run {runs:4d}  RSS {rss_mb():7.1f} MB  games created {created:3d}  "
+                  f"live games {len(games)}  stack depth {len(traceback.extract_stack())}")
+        runs += 1
+        if runs >= total_runs or runs % (restarts_per_game + 1) == 0:
+            return 'quit'
+        return 'restart'
+
+    def menu_stand_in():
+        """Pick the song again from the main menu, until every run is done."""
+        if runs >= total_runs:
+            return None
+        return (menu.start_game, 'song1', 'hard')
+
+    Game.run = short_run
+    menu.main_menu = menu_stand_in
+    # Don't wait between restarts, this only measures what is left behind
+    pygame.time.wait = lambda ms: None
+    menu.run_scenes(menu.start_game, 'song1', 'hard')
+    gc.collect()
+    print(f"done {runs:4d}  RSS {rss_mb():7.1f} MB  games created {created:3d}  live games {len(games)}")
+
+
+if __name__ == "__main__":
+    main()
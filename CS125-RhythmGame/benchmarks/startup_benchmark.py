@@ -0,0 +1,77 @@
+"""Startup benchmark for the chart loading path.
+
+Each case runs in a fresh interpreter so import costs are measured cold.
+Usage: python benchmarks/startup_benchmark.py [path/to/key_log.csv]
+"""
+import json
+import os
+import subprocess
+import sys
+
+from _setup import ROOT, START_DIR
+
+DEFAULT_CHART = os.path.join('assets', 'songs', 'Song 1', 'key_log.csv')
+
+# Runs inside the child interpreter, `body` is the code under test
+TEMPLATE = '''
+import os, sys, time, json
+sys.path.insert(0, {setup_dir!r})
+import _setup
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss_kb //= 1024
+except ImportError:
+    rss_kb = None
+print(json.dumps({{'seconds': elapsed, 'max_rss_kb': rss_kb, 'pandas_loaded': 'pandas' in sys.modules}}))
+'''
+
+# Both cases import the same game modules the menu does and then read the chart
+GAME_IMPORTS = (
+    "import pygame\n"
+    "pygame.init()\n"
+    "pygame.display.set_mode((1, 1))\n"
+    "import game.game\n"
+)
+
+CASES = {
+    'pandas read_csv (old path)': GAME_IMPORTS + (
+        "import pandas as pd\n"
+        "df = pd.read_csv(CHART)\n"
+        "rows = [(float(r['timestamp']), str(r['key'])) for _, r in df.iterrows()]"
+    ),
+    'streaming reader': GAME_IMPORTS + (
+        "from game.chart_reader import iter_chart\n"
+        "rows = list(iter_chart(CHART))"
+    ),
+}
+
+
+def run_case(body, chart):
+    code = TEMPLATE.format(setup_dir=os.path.dirname(os.path.abspath(__file__)), body=f"CHART = {chart!r}\n{body}")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    # The children run from ROOT, so a chart given on the command line is resolved from where this was started
+    chart = os.path.join(START_DIR, sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CHART
+    results = {}
+    for name, body in CASES.items():
+        results[name] = result = run_case(body, chart)
+        if 'error' in result:
+            print(f"{name:30s} skipped: {result['error']}")
+            continue
+        rss = f"{result['max_rss_kb'] / 1024:.1f} MB" if result['max_rss_kb'] else "n/a"
+        print(f"{name:30s} {result['seconds'] * 1000:8.1f} ms  max RSS {rss:>9s}  pandas loaded: {result['pandas_loaded']}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
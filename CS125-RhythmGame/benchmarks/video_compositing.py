@@ -0,0 +1,77 @@
+"""Background video draw cost: per-frame translucent surface versus frames dimmed by the decoder.
+
+Both variants play the same video at the game's frame rate and time only
+the draw call, the same way Game.draw uses it (force_draw on every frame).
+
+Usage: python benchmarks/video_compositing.py [video] [seconds]
+"""
+import os
+import statistics
+import sys
+import time
+
+import _setup
+
+import pygame
+
+from game.constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT
+from game.pyvidplayer import Video
+
+
+class TranslucentVideo(Video):
+    """The previous draw path: a new SRCALPHA surface and two blits every frame."""
+
+    def __init__(self, path, transparency=128):
+        # Decode undimmed frames and apply the transparency while drawing
+        super().__init__(path, transparency=255)
+        self.transparency = transparency
+
+    def update(self):
+        if not self.ring or self.ring[-1] is self.image:
+            return False
+        self.image = self.ring[-1]
+        return True
+
+    def draw(self, surf, pos, force_draw=True):
+        if self.active:
+            if self.update() or force_draw:
+                temp_surface = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
+                temp_surface.blit(self.image, (0, 0))
+                temp_surface.set_alpha(self.transparency)
+                surf.blit(temp_surface, pos)
+
+
+def measure(video_class, path, seconds, display):
+    video = video_class(path, transparency=102)
+    video.set_size((WINDOW_WIDTH, WINDOW_HEIGHT))
+    clock = pygame.time.Clock()
+    samples = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        video.draw(display, (0, 0))
+        samples.append((time.perf_counter() - start) * 1000)
+        clock.tick(FPS)
+    decoded = video.frames
+    video.close()
+    return samples, decoded
+
+
+def report(name, samples, decoded):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:22s} median {statistics.median(samples):7.3f} ms  p99 {p99:7.3f} ms  "
+          f"max {samples[-1]:7.3f} ms  ({len(samples)} draws, {decoded} decoded frames)")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join('assets', 'vids', 'song1.mp4')
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    pygame.init()
+    display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    report("SRCALPHA per frame (old)", *measure(TranslucentVideo, path, seconds, display))
+    report("decoder-dimmed frame", *measure(Video, path, seconds, display))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Video frame upload cost: RGB bytearray copies versus decoding into persistent surfaces.
+
+The old path asked ffpyplayer for a bytearray copy of every RGB frame,
+wrapped it in a new surface and converted it to the display format while
+drawing. The new path decodes in the display's own pixel layout and copies
+each frame once, straight into a reused surface.
+
+Usage: python benchmarks/video_upload.py [video] [seconds]
+"""
+import os
+import statistics
+import sys
+import time
+
+import _setup
+
+import pygame
+
+from game.constants import FPS, WINDOW_WIDTH, WINDOW_HEIGHT
+from game.pyvidplayer import Video
+
+
+class TimedVideo(Video):
+    """Records how long the decode thread spends turning each frame into a surface."""
+
+    def __init__(self, path, transparency=128):
+        self.upload_samples = []
+        super().__init__(path, transparency)
+
+    def _upload(self, img):
+        start = time.perf_counter()
+        surface = super()._upload(img)
+        self.upload_samples.append((time.perf_counter() - start) * 1000)
+        return surface
+
+
+class BytearrayVideo(TimedVideo):
+    """The previous upload path: RGB output copied into a new bytearray per frame."""
+
+    def _native_format(self):
+        return None
+
+    def _upload(self, img):
+        start = time.perf_counter()
+        surface = pygame.image.frombuffer(img.to_bytearray()[0], img.get_size(), "RGB")
+        self.upload_samples.append((time.perf_counter() - start) * 1000)
+        return surface
+
+
+def measure(video_class, path, seconds, display):
+    video = video_class(path, transparency=102)
+    video.set_size((WINDOW_WIDTH, WINDOW_HEIGHT))
+    clock = pygame.time.Clock()
+    draw_samples = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        draw_start = time.perf_counter()
+        video.draw(display, (0, 0))
+        draw_samples.append((time.perf_counter() - draw_start) * 1000)
+        clock.tick(FPS)
+    elapsed = time.perf_counter() - start
+    video.close()
+    return video.upload_samples, draw_samples, video.copy_bytes_saved / elapsed
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def report(name, upload_samples, draw_samples, saved_per_second):
+    print(f"{name:26s} upload median {statistics.median(upload_samples):6.3f} ms  p99 {percentile(upload_samples, 0.99):6.3f} ms  "
+          f"draw median {statistics.median(draw_samples):6.3f} ms  copies saved {saved_per_second / 1e6:7.1f} MB/s")
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join('assets', 'vids', 'song1.mp4')
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    pygame.init()
+    display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    report("RGB bytearray (old)", *measure(BytearrayVideo, path, seconds, display))
+    report("native persistent surface", *measure(TimedVideo, path, seconds, display))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,16 @@
-import queue
-import pandas as pd
 from game.constants import SPAWN_WINDOW, WINDOW_WIDTH, WINDOW_HEIGHT, ARROW_SPACING, NORMAL_HIT_ZONE_Y, GRAVITY_HIT_ZONE_Y
 from Sprites.tiles import Tiles, spawn_positions
 from game.pattern_manager import PatternManager
+from game.chart_cache import load_chart, MASK_KEYS
+from game.note_timeline import NoteTimeline
+from array import array
 import os
 import pygame
 import random
 
 class ArrowSpawner:
-    def __init__(self, arrows, songs_data):
-        self.spawn_queue = queue.Queue()
-        self.timestamp_key_dict = {}
+    def __init__(self, arrows, songs_data, hit_detector=None):
+        self.timeline = NoteTimeline()
         self.arrows = arrows
         self.key_to_arrow = {
             'd': 'left_arrow',
@@ -23,6 +23,7 @@ class ArrowSpawner:
         self.difficulty = 'easy'  # Default, will be set in pattern mode
         self.spawning_allowed = True # Flag to control spawning
         self.songs_data = songs_data # Store the songs data
+        self.hit_detector = hit_detector # Told about every spawned note
         self.last_spawn_time = 0
         self.spawn_delay = 1.0  # Base delay between spawns
         self.pattern_mode = False
@@ -30,6 +31,17 @@ class ArrowSpawner:
         self.pattern = []
         self.timestamps = []
 
+    def reset(self):
+        """Rewind to the first note for a restart, keeping the loaded chart."""
+        self.spawning_allowed = True
+        if self.pattern_mode:
+            self.start_pattern_mode(self.difficulty)
+            return
+        if self.difficulty == 'hard':
+            # Each play of a hard chart gets a new lane shuffle, as on a fresh load
+            random.shuffle(self.timeline.lane_masks)
+        self.timeline.seek(0.0)
+
     def get_sprite(self, key):
         """Get the sprite for a given key."""
         arrow_key = self.key_to_arrow.get(key)
@@ -38,61 +50,47 @@ class ArrowSpawner:
         return None
 
     def spawn_arrow(self, current_time, arrow_group, gravity_mode=False):
-        """Spawn a new arrow based on the current game mode and time."""
+        """Spawn every note that falls inside the spawn window.
+
+        arrow_group is either a sprite group, which receives Tiles sprites,
+        or a NoteEngine.
+        """
         if not self.spawning_allowed:
             return
 
-        if self.use_patterns:
-            # Use key log timestamps for timing, but select pattern for each
-            if not self.spawn_queue.empty():
-                item = self.spawn_queue.queue[0]
-                if 0 <= item - current_time <= SPAWN_WINDOW:
-                    timestamp = round(self.spawn_queue.get(), 3)
-                    # Instead of using the original key, select a pattern
-                    pattern_keys = self.pattern_manager.get_weighted_pattern(self.difficulty)
-                    for key in pattern_keys:
-                        tile_img = self.get_sprite(key)
-                        if tile_img is None:
-                            print(f"[ERROR] No sprite found for key: '{key}'")
-                            continue
-                        tile = Tiles(tile_img, spawn_positions[key], key)
-                        if gravity_mode:
-                            # In gravity mode, spawn at the bottom of the screen
-                            tile.rect.bottom = WINDOW_HEIGHT + 100
-                        else:
-                            # In normal mode, spawn at the top of the screen
-                            tile.rect.top = -100
-                        arrow_group.add(tile)
-            return
+        start, end = self.timeline.due(current_time, SPAWN_WINDOW)
+        for index in range(start, end):
+            note_time = self.timeline.times[index]
+            if self.use_patterns:
+                # Use the timeline for timing, but select a pattern for each note
+                keys = self.pattern_manager.get_weighted_pattern(self.difficulty)
+            else:
+                keys = MASK_KEYS[self.timeline.lane_masks[index]]
 
-        # Normal mode (using CSV timestamps)
-        if not self.spawn_queue.empty():
-            item = self.spawn_queue.queue[0]
-            if 0 <= item - current_time <= SPAWN_WINDOW:
-                timestamp = round(self.spawn_queue.get(), 3)
-                keys = self.timestamp_key_dict.get(timestamp, [])
-                
-                # Handle both single key and list of keys
-                if isinstance(keys, str):
-                    keys = [keys]
-                
-                for key in keys:
-                    if not key:
-                        continue
-                        
-                    tile_img = self.get_sprite(key)
-                    if tile_img is None:
-                        print(f"[ERROR] No sprite found for key: '{key}'")
-                        continue
-                        
-                    tile = Tiles(tile_img, spawn_positions[key], key)
-                    if gravity_mode:
-                        # In gravity mode, spawn at the bottom of the screen
-                        tile.rect.bottom = WINDOW_HEIGHT + 100
-                    else:
-                        # In normal mode, spawn at the top of the screen
-                        tile.rect.top = -100
-                    arrow_group.add(tile)
+            for key in keys:
+                if not isinstance(arrow_group, pygame.sprite.AbstractGroup):
+                    # Note engine, which only needs the lane, position and time
+                    y = WINDOW_HEIGHT + 100 - arrow_group.height if gravity_mode else -100
+                    slot = arrow_group.add_note(key, y, note_time)
+                    if self.hit_detector:
+                        self.hit_detector.track(key, note_time, slot)
+                    continue
+
+                tile_img = self.get_sprite(key)
+                if tile_img is None:
+                    print(f"[ERROR] No sprite found for key: '{key}'")
+                    continue
+
+                tile = Tiles(tile_img, spawn_positions[key], key, note_time)
+                if gravity_mode:
+                    # In gravity mode, spawn at the bottom of the screen
+                    tile.rect.bottom = WINDOW_HEIGHT + 100
+                else:
+                    # In normal mode, spawn at the top of the screen
+                    tile.rect.top = -100
+                arrow_group.add(tile)
+                if self.hit_detector:
+                    self.hit_detector.track(key, note_time, tile)
 
     def add_timestamps(self, song_key):
         """Add timestamps from the song's CSV file."""
@@ -102,8 +100,7 @@ class ArrowSpawner:
             return
 
         # Clear existing timestamps
-        self.spawn_queue = queue.Queue()
-        self.timestamp_key_dict = {}
+        self.timeline = NoteTimeline()
 
         # Get the key log file path
         key_log_file = song_info.get("key_log_file")
@@ -112,43 +109,19 @@ class ArrowSpawner:
             return
 
         try:
-            # Read the CSV file
-            df = pd.read_csv(key_log_file)
-            
+            # Load the compiled chart, rebuilding it only if the CSV changed
+            chart = load_chart(key_log_file)
+            lane_masks = chart.lane_masks
+
             # In hard mode, shuffle the keys while keeping timestamps
             if self.difficulty == 'hard':
-                # Get all keys and shuffle them
-                all_keys = df['key'].tolist()
-                random.shuffle(all_keys)
-                # Replace the original keys with shuffled ones
-                df['key'] = all_keys
-            
-            # Process each row
-            for _, row in df.iterrows():
-                timestamp = round(float(row['timestamp']), 3)
-                keys = str(row['key']).strip()  # Convert to string and remove whitespace
-                
-                # Split keys if multiple are present (comma-separated)
-                if ',' in keys:
-                    keys = [k.strip() for k in keys.split(',')]
-                else:
-                    keys = [keys]
-                
-                # Validate all keys
-                valid_keys = []
-                for key in keys:
-                    if key in self.key_to_arrow:
-                        valid_keys.append(key)
-                    else:
-                        print(f"[WARNING] Invalid key '{key}' found in CSV, skipping")
-                
-                if valid_keys:
-                    # Add to queues
-                    self.spawn_queue.put(timestamp)
-                    self.timestamp_key_dict[timestamp] = valid_keys
-            
-            print(f"[DEBUG] Loaded {len(df)} timestamps from {key_log_file}")
-            
+                lane_masks = array('B', lane_masks)
+                random.shuffle(lane_masks)
+
+            self.timeline = NoteTimeline(chart.timestamps, lane_masks)
+
+            print(f"[DEBUG] Loaded {len(chart)} timestamps from {key_log_file}")
+
         except FileNotFoundError:
             print(f"[ERROR] Key log file not found: {key_log_file}")
         except Exception as e:
@@ -161,14 +134,14 @@ class ArrowSpawner:
         self.pattern_mode = True
         self.pattern_index = 0
         self.pattern = []
-        self.spawn_queue = queue.Queue()
-        self.timestamp_key_dict = {}
-        
-        # Generate initial timestamps for pattern mode
+
+        # Generate initial timestamps for pattern mode, keys are picked at spawn time
+        times = array('d')
         current_time = 0
         while current_time < 300:  # 5 minutes of patterns
-            self.spawn_queue.put(current_time)
+            times.append(current_time)
             current_time += random.uniform(0.5, 1.5)  # Random interval between patterns
+        self.timeline = NoteTimeline(times, array('B', bytes(len(times))))
 
 class Arrow(pygame.sprite.Sprite):
     def __init__(self, image, key):
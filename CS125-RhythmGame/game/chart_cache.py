@@ -0,0 +1,149 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+
+from game.chart_reader import iter_chart
+from game.constants import LANE_KEYS
+
+# Each lane key owns one bit of the per-row lane mask
+KEY_BITS = {key: 1 << i for i, key in enumerate(LANE_KEYS)}
+# Lookup table from a lane mask back to the keys it contains
+MASK_KEYS = [tuple(key for key in LANE_KEYS if mask & KEY_BITS[key]) for mask in range(1 << len(LANE_KEYS))]
+
+CACHE_SUFFIX = '.chart'
+CACHE_MAGIC = b'RCHT'
+CACHE_VERSION = 1
+# magic, version, csv mtime (ns), csv size, csv sha1, row count
+HEADER = struct.Struct('<4sHqq20sI')
+# Timestamps start on an 8-byte boundary so they can be cast in place
+DATA_OFFSET = (HEADER.size + 7) // 8 * 8
+
+
+class CompiledChart:
+    """Read-only view of a compiled chart, backed by a memory map or by in-memory arrays."""
+
+    def __init__(self, path, timestamps, lane_masks, mm=None):
+        self.path = path  # None if the chart could not be cached
+        self._mm = mm
+        self.timestamps = timestamps
+        self.lane_masks = lane_masks
+
+    @classmethod
+    def from_map(cls, path, mm, count):
+        view = memoryview(mm)
+        ts_end = DATA_OFFSET + 8 * count
+        return cls(path, view[DATA_OFFSET:ts_end].cast('d'), view[ts_end:ts_end + count].cast('B'), mm)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def keys_at(self, index):
+        """Get the lane keys for a row."""
+        return MASK_KEYS[self.lane_masks[index]]
+
+
+def cache_path_for(csv_path):
+    """Get the path of the compiled chart stored next to a CSV file."""
+    return os.path.splitext(csv_path)[0] + CACHE_SUFFIX
+
+
+def _hash_file(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _parse_csv(csv_path):
+    """Parse a key log CSV into sorted timestamps and lane masks."""
+    rows = []
+    for timestamp, keys in iter_chart(csv_path):
+        mask = 0
+        for key in keys:
+            mask |= KEY_BITS[key]
+        rows.append((timestamp, mask))
+    rows.sort(key=lambda row: row[0])
+    return array('d', (row[0] for row in rows)), array('B', (row[1] for row in rows))
+
+
+def compile_chart(csv_path, stat=None, digest=None):
+    """Compile a key log CSV into its binary cache file."""
+    stat = stat or os.stat(csv_path)
+    digest = digest or _hash_file(csv_path)
+    timestamps, lane_masks = _parse_csv(csv_path)
+
+    out_path = cache_path_for(csv_path)
+    tmp_path = out_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(CACHE_MAGIC, CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, len(timestamps)))
+            f.write(b'\0' * (DATA_OFFSET - HEADER.size))
+            f.write(timestamps.tobytes())
+            f.write(lane_masks.tobytes())
+        os.replace(tmp_path, out_path)
+    except OSError:
+        # Don't leave a partial file behind, e.g. when the disk is full
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    print(f"[DEBUG] Compiled {len(timestamps)} rows from {csv_path}")
+    return out_path
+
+
+def _read_header(path):
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(data) != HEADER.size:
+        return None
+    magic, version, mtime_ns, size, digest, count = HEADER.unpack(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    if os.path.getsize(path) != DATA_OFFSET + 9 * count:
+        return None
+    return mtime_ns, size, digest, count
+
+
+def _refresh_header(path, stat, digest, count):
+    """Record a new CSV mtime for a cache whose contents are still valid."""
+    with open(path, 'r+b') as f:
+        f.write(HEADER.pack(CACHE_MAGIC, CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, count))
+
+
+def load_chart(csv_path):
+    """Load the compiled chart for a CSV, rebuilding it only if the CSV changed.
+
+    The cache is only an optimization: if it cannot be written or read
+    (read-only install, permissions, full disk), the CSV is parsed into
+    memory instead.
+    """
+    stat = os.stat(csv_path)
+    path = cache_path_for(csv_path)
+    header = _read_header(path)
+
+    try:
+        if header is None:
+            compile_chart(csv_path, stat)
+        else:
+            mtime_ns, size, cached_digest, count = header
+            if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                # The file was touched, only rebuild if its contents changed
+                digest = _hash_file(csv_path)
+                if digest == cached_digest:
+                    _refresh_header(path, stat, digest, count)
+                else:
+                    compile_chart(csv_path, stat, digest)
+
+        count = _read_header(path)[3]
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError as e:
+        print(f"[WARNING] Chart cache {path} is unavailable ({e}), loading {csv_path} without it")
+        timestamps, lane_masks = _parse_csv(csv_path)
+        return CompiledChart(None, timestamps, lane_masks)
+    return CompiledChart.from_map(path, mm, count)
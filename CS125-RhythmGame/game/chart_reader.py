@@ -0,0 +1,38 @@
+import csv
+
+from game.constants import LANE_KEYS
+
+
+def iter_chart(csv_path):
+    """Stream (timestamp, keys) records from a key log CSV.
+
+    Rows are yielded in file order. Unknown keys are dropped with a warning
+    and rows left without any valid key are skipped.
+    """
+    with open(csv_path, newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                timestamp = float(row['timestamp'])
+            except (TypeError, ValueError):
+                print(f"[WARNING] Invalid timestamp '{row['timestamp']}' found in CSV, skipping")
+                continue
+
+            keys = []
+            for key in (row['key'] or '').split(','):
+                key = key.strip()
+                if key in LANE_KEYS:
+                    keys.append(key)
+                else:
+                    print(f"[WARNING] Invalid key '{key}' found in CSV, skipping")
+            if keys:
+                yield timestamp, keys
+
+
+def read_chart_dataframe(csv_path):
+    """Read a key log CSV into a pandas DataFrame, for offline tooling only.
+
+    pandas is imported lazily so the game itself never pays for it.
+    """
+    import pandas as pd
+    return pd.DataFrame(iter_chart(csv_path), columns=['timestamp', 'keys'])
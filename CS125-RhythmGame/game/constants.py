@@ -3,10 +3,11 @@ WINDOW_WIDTH = 1600
 WINDOW_HEIGHT = 900
 FPS = 60
 
-# Hit detection margins
-HIT_MARGIN_PERFECT = 20
-HIT_MARGIN_GOOD = 65
-HIT_MARGIN_LATE = 100
+# Hit windows, measured from a note's chart time to the key press
+# (the old 20/65/100 pixel margins at BASE_ARROW_SPEED * FPS pixels per second)
+HIT_WINDOW_PERFECT_MS = 35
+HIT_WINDOW_GOOD_MS = 115
+HIT_WINDOW_LATE_MS = 175
 
 # Scoring system
 SCORE_PERFECT = 100
@@ -36,6 +37,19 @@ SPAWN_WINDOW = 1.55
 MUSIC_START_DELAY = 5.0
 VIDEO_START_DELAY = 4.4
 
+# Note storage: "numpy" uses the NoteEngine arrays, "sprites" uses Tiles sprites
+NOTE_BACKEND = "numpy"
+
+# Rendering: "dirty" pushes only changed regions when there is no video background,
+# "full" redraws and updates the whole window every frame
+RENDER_MODE = "dirty"
+
+# Longest a static screen (pause, results) sleeps waiting for input, in milliseconds
+IDLE_EVENT_TIMEOUT_MS = 250
+
+# Lane keys from left to right
+LANE_KEYS = ['d', 'f', 'j', 'k']
+
 # Arrow and outline spacing
 ARROW_SPACING = 200  # Space between arrows horizontally
 OUTLINE_SPACING = 200  # Space between outlines horizontally
@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+import time
+from array import array
+
+import pygame
+
+# Phases timed every frame, in the order they run
+FRAME_PHASES = ('events', 'update', 'spawn', 'video', 'draw', 'hud', 'present', 'total')
+# Frames kept in the ring buffer, about 4.5 minutes at 60 FPS
+FRAME_TIMER_SIZE = 16384
+# Where the per-song dumps are written
+FRAME_TIMES_DIR = os.path.join('logs', 'frame_times')
+
+# Overlay: statistics over the most recent frames, refreshed every few frames
+OVERLAY_WINDOW = 240
+OVERLAY_REFRESH_FRAMES = 30
+OVERLAY_BUDGET_MS = 1000 / 60  # Bar scale, a full bar is one 60 FPS frame
+OVERLAY_BAR_WIDTH = 200
+OVERLAY_ROW_HEIGHT = 20
+OVERLAY_MARGIN = 10
+
+
+def percentile(ordered, fraction):
+    """Get a percentile from already sorted samples."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameTimer:
+    """Per-phase frame times in milliseconds, kept in a fixed-size ring buffer.
+
+    Call start() and stop() around each phase and end_frame() once per frame.
+    A phase that runs more than once in a frame adds up. Recording is a
+    perf_counter() call and an array write, so it is always on.
+    """
+
+    def __init__(self, size=FRAME_TIMER_SIZE):
+        self.size = size
+        self.samples = {phase: array('d', bytes(8 * size)) for phase in FRAME_PHASES}
+        self.started = dict.fromkeys(FRAME_PHASES, 0.0)
+        self.index = 0  # Slot of the frame being recorded
+        self.count = 0  # Frames recorded, up to size
+        self.overlay = None
+        self.overlay_age = 0
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples[self.index] = 0.0
+        self.count = 0
+        self.overlay = None
+
+    def start(self, phase):
+        self.started[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        self.samples[phase][self.index] += (time.perf_counter() - self.started[phase]) * 1000
+
+    def end_frame(self):
+        """Close the current frame and clear the slot of the next one."""
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        for samples in self.samples.values():
+            samples[self.index] = 0.0
+        self.overlay_age += 1
+
+    def recent(self, phase, frames=None):
+        """Get a phase's samples for the last frames (all recorded ones by default), oldest first."""
+        frames = self.count if frames is None else min(frames, self.count)
+        samples = self.samples[phase]
+        start = self.index - frames
+        if start >= 0:
+            return samples[start:self.index].tolist()
+        return samples[start:].tolist() + samples[:self.index].tolist()
+
+    def stats(self, frames=None):
+        """Get p50, p99, max and mean per phase over the last frames."""
+        stats = {}
+        for phase in FRAME_PHASES:
+            ordered = sorted(self.recent(phase, frames))
+            stats[phase] = {
+                'p50': percentile(ordered, 0.5),
+                'p99': percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0,
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0
+            }
+        return stats
+
+    def dump(self, song_key, difficulty, directory=FRAME_TIMES_DIR):
+        """Write every recorded frame to CSV and the per-phase summary to JSON.
+
+        Returns the path of the CSV file, or None if nothing could be written.
+        """
+        if not self.count:
+            return None
+        name = f"{song_key}_{difficulty}_{time.strftime('%Y%m%d-%H%M%S')}"
+        csv_path = os.path.join(directory, name + '.csv')
+        try:
+            os.makedirs(directory, exist_ok=True)
+            columns = [self.recent(phase) for phase in FRAME_PHASES]
+            with open(csv_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(('frame',) + FRAME_PHASES)
+                for frame, row in enumerate(zip(*columns)):
+                    writer.writerow([frame] + [f"{ms:.4f}" for ms in row])
+            with open(os.path.join(directory, name + '.json'), 'w') as f:
+                json.dump({'song': song_key,
+                           'difficulty': difficulty,
+                           'frames': self.count,
+                           'phases': self.stats()}, f, indent=2)
+        except OSError as e:
+            print(f"[WARNING] Could not write frame times to {directory}: {e}")
+            return None
+        print(f"[DEBUG] Frame times for {self.count} frames written to {csv_path}")
+        return csv_path
+
+    def get_overlay(self, font):
+        """Get the p50/p99/max graph of the recent frames, rebuilt every few frames."""
+        if self.overlay is None or self.overlay_age >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self._render_overlay(font, self.stats(OVERLAY_WINDOW))
+            self.overlay_age = 0
+        return self.overlay
+
+    def _render_overlay(self, font, stats):
+        label_width = 80
+        text_width = 170
+        width = label_width + OVERLAY_BAR_WIDTH + text_width + 2 * OVERLAY_MARGIN
+        height = (len(FRAME_PHASES) + 1) * OVERLAY_ROW_HEIGHT + 2 * OVERLAY_MARGIN
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))
+
+        header = font.render("p50 / p99 / max ms", True, (200, 200, 200))
+        surface.blit(header, (OVERLAY_MARGIN + label_width + OVERLAY_BAR_WIDTH + 5, OVERLAY_MARGIN))
+        scale = OVERLAY_BAR_WIDTH / OVERLAY_BUDGET_MS
+        for row, phase in enumerate(FRAME_PHASES, start=1):
+            y = OVERLAY_MARGIN + row * OVERLAY_ROW_HEIGHT
+            x = OVERLAY_MARGIN + label_width
+            phase_stats = stats[phase]
+            surface.blit(font.render(phase, True, (255, 255, 255)), (OVERLAY_MARGIN, y))
+            # Max as a thin line, p99 as a dim bar and p50 as a bright bar on top
+            max_x = x + min(OVERLAY_BAR_WIDTH, int(phase_stats['max'] * scale))
+            pygame.draw.line(surface, (255, 80, 80), (max_x, y + 2), (max_x, y + OVERLAY_ROW_HEIGHT - 4), 2)
+            p99_width = min(OVERLAY_BAR_WIDTH, int(phase_stats['p99'] * scale))
+            pygame.draw.rect(surface, (120, 120, 0), (x, y + 4, p99_width, OVERLAY_ROW_HEIGHT - 8))
+            p50_width = min(OVERLAY_BAR_WIDTH, int(phase_stats['p50'] * scale))
+            pygame.draw.rect(surface, (0, 200, 0), (x, y + 4, p50_width, OVERLAY_ROW_HEIGHT - 8))
+            text = f"{phase_stats['p50']:.2f} / {phase_stats['p99']:.2f} / {phase_stats['max']:.2f}"
+            surface.blit(font.render(text, True, (255, 255, 255)), (x + OVERLAY_BAR_WIDTH + 5, y))
+        return surface
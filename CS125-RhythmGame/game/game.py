@@ -9,14 +9,36 @@ from game.constants import (
     GRAVITY_NORMAL_MIN_DURATION, GRAVITY_NORMAL_MAX_DURATION,
     SCORE_POSITION, MISS_POSITION, COMBO_POSITION, FEEDBACK_POSITION,
     NORMAL_HIT_ZONE_Y, GRAVITY_HIT_ZONE_Y, GRAVITY_SAFE_INTERVAL,
-    VIDEO_START_DELAY
+    VIDEO_START_DELAY, NOTE_BACKEND, RENDER_MODE, IDLE_EVENT_TIMEOUT_MS
 )
 from game.hit_detection import HitDetector
 from game.arrow_spawner import ArrowSpawner
 from game.outline_manager import OutlineManager
 from Utility.font_manager import font_manager
-from Utility.audio_manager import audio_manager
+from Utility.audio_manager import audio_manager, SongClock
+from Utility.gc_manager import gc_manager
+from Utility.profiler import profiler
 from game.pyvidplayer import Video
+from game.renderer import DirtyRenderer
+from game.popup import PopupLayer
+from game.frame_timer import FrameTimer
+try:
+    from game.note_engine import NoteEngine
+except ImportError:  # NumPy is optional, fall back to sprites
+    NoteEngine = None
+
+# Lane key for each pygame key code
+KEY_BINDINGS = {
+    pygame.K_d: 'd',
+    pygame.K_f: 'f',
+    pygame.K_j: 'j',
+    pygame.K_k: 'k'
+}
+# Shows or hides the frame timing overlay
+FRAME_OVERLAY_KEY = pygame.K_F3
+# Captures a CPU profile of the next few seconds (see Utility/profiler.py)
+PROFILE_KEY = pygame.K_F4
+
 # SONGS will be passed in from the menu
 # from game.menu import SONGS
 
@@ -35,9 +57,16 @@ class Game:
         # Initialize game components
         self.arrow_group = pygame.sprite.Group()
         self.outline_group = pygame.sprite.Group()
+        # Notes live in the NumPy note engine, with sprites as a fallback
+        if NOTE_BACKEND == "numpy" and NoteEngine is not None:
+            self.note_engine = NoteEngine(arrows)
+            self.notes = self.note_engine
+        else:
+            self.note_engine = None
+            self.notes = self.arrow_group
         self.hit_detector = HitDetector()
         # Pass the selected song_key and songs_data to the ArrowSpawner
-        self.arrow_spawner = ArrowSpawner(arrows, self.songs_data)
+        self.arrow_spawner = ArrowSpawner(arrows, self.songs_data, self.hit_detector)
         self.arrow_spawner.difficulty = difficulty  # Set the difficulty in ArrowSpawner
         self.outline_manager = OutlineManager(outlines)
         
@@ -59,7 +88,7 @@ class Game:
         self.combo_font = font_manager.get_font(48)  # Smaller font for combo
         
         # Initialize game state
-        self.start_ticks = pygame.time.get_ticks()
+        self.clock = SongClock(audio_manager)  # Master song time for update, spawning and judgement
         self.running = True
         self.song_key = song_key
         self.difficulty = difficulty
@@ -76,6 +105,8 @@ class Game:
         self.paused = False
         self.pause_frame = None
         self.pause_buttons = []
+        self.pause_layer = None
+        self.results_layer = None
         self.pause_font = font_manager.get_font(72)
         self.pause_small_font = font_manager.get_font(48)
         self.mode = mode
@@ -84,13 +115,12 @@ class Game:
         # Load background video
         video_path = os.path.join('assets', 'vids', f'song{song_key[-1]}.mp4')  # Use song number for video
         try:
-            self.background_video = Video(video_path)
+            # Video at 40% opacity, dimmed by the decoder
+            self.background_video = Video(video_path, transparency=102)  # 255 * 0.4 = 102
             # Optionally resize the video to fit the screen
             self.background_video.set_size((WINDOW_WIDTH, WINDOW_HEIGHT))
-            # Set video transparency to 40% opacity
-            self.background_video.set_transparency(102)  # 255 * 0.4 = 102
             # Pause the video immediately
-            self.background_video.toggle_pause()
+            self.background_video.pause()
         except FileNotFoundError:
             print(f"[WARNING] Background video not found at {video_path}")
             self.background_video = None
@@ -106,6 +136,7 @@ class Game:
         self.countdown_start = 0
         self.countdown_duration = 5000  # 5 seconds in milliseconds
         self.countdown_font = font_manager.get_font(72)  # Larger font for countdown
+        self.countdown_layers = {}  # Countdown number and its backdrop, composed once per number
         
         # Load game data
         if song_key == "pattern":
@@ -127,6 +158,19 @@ class Game:
 
         self.outline_manager.add_outlines(self.outline_group, self.gravity_mode)
 
+        # Only the regions that changed are pushed to the window, unless a video is playing
+        self.renderer = DirtyRenderer(self.display)
+        self.dirty_frame = False
+        self.update_static_layer()
+
+        # Per-phase frame times, always recorded, shown with FRAME_OVERLAY_KEY
+        self.timer = FrameTimer()
+        self.show_frame_overlay = False
+        self.overlay_font = font_manager.get_font(14)
+
+        # Everything is loaded, keep the collector quiet until the song ends
+        gc_manager.begin_song()
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -140,35 +184,50 @@ class Game:
                     elif self.paused:
                         self.resume_game()
                     return
+                elif event.key == FRAME_OVERLAY_KEY:
+                    self.show_frame_overlay = not self.show_frame_overlay
+                elif event.key == PROFILE_KEY:
+                    profiler.start(f"{self.song_key}_{self.difficulty}")
                 elif not self.paused and not self.show_results:
-                    if event.key == pygame.K_d:
-                        self.hit_detector.check_hit('d', self.arrow_group, self.outline_group)
-                    elif event.key == pygame.K_f:
-                        self.hit_detector.check_hit('f', self.arrow_group, self.outline_group)
-                    elif event.key == pygame.K_j:
-                        self.hit_detector.check_hit('j', self.arrow_group, self.outline_group)
-                    elif event.key == pygame.K_k:
-                        self.hit_detector.check_hit('k', self.arrow_group, self.outline_group)
+                    key = KEY_BINDINGS.get(event.key)
+                    if key:
+                        self.hit_detector.check_hit(key, self.notes, self.event_song_time(event))
+
+    def event_song_time(self, event):
+        """Get the song time of an input event in seconds.
+
+        Uses the SDL timestamp of the event when pygame exposes it, otherwise
+        the tick count when the event is handled. Both are monotonic.
+        """
+        event_ticks = getattr(event, 'timestamp', None)
+        if event_ticks is None:
+            return self.clock.now()
+        return self.clock.ticks_to_song_time(event_ticks)
 
     def update(self):
-        elapsed_ms = pygame.time.get_ticks() - self.start_ticks
-        elapsed_sec = elapsed_ms / 1000
+        # Lock the song time to the music before anything reads it
+        self.clock.update()
+        elapsed_sec = self.clock.now()
 
         # Start music after delay
         if elapsed_sec >= MUSIC_START_DELAY and not self.music_started:
             try:
                 audio_manager.play_music(self.music_path)
+                self.clock.attach_music(MUSIC_START_DELAY)
                 self.music_started = True
+                profiler.start_from_env(f"{self.song_key}_{self.difficulty}")
             except Exception as e:
                 print(f"[ERROR] Failed to play music: {e}")
 
         # Unpause video after delay if it's paused
-        if self.background_video and self.background_video.get_playback_data()['paused'] and elapsed_sec >= VIDEO_START_DELAY:
-             self.background_video.toggle_pause()
+        if self.background_video and not self.paused and not self.show_results and elapsed_sec >= VIDEO_START_DELAY:
+             self.background_video.resume()
 
         # Update video frames if game is running and video is active
         if not self.paused and not self.show_results and self.background_video and self.background_video.active:
+             self.timer.start('video')
              self.background_video.update()
+             self.timer.stop('video')
 
         # Check for gravity mode switch
         self.check_gravity_switch()
@@ -182,41 +241,44 @@ class Game:
             if pygame.time.get_ticks() - self.song_end_time >= 1000:
                 self.show_results = True
                 self.waiting_for_results = False
+                # The results popup hides the video, so stop decoding it
+                if self.background_video:
+                    self.background_video.pause()
                 self.init_results_popup()
+                self.results_layer = None
             return
 
         # Detect end of song (music stopped) - only in normal mode
         if self.mode == "normal":
-            if self.music_started and not pygame.mixer.music.get_busy() and not self.waiting_for_results and not self.paused:
+            if self.music_started and not audio_manager.is_music_playing() and not self.waiting_for_results and not self.paused:
                 self.final_score = self.hit_detector.score
                 self.final_time = elapsed_sec
                 self.song_end_time = pygame.time.get_ticks()
                 self.last_frame = self.display.copy()
                 self.waiting_for_results = True
-                self.arrow_group.empty()
+                self.notes.empty()
+                self.hit_detector.clear_notes()
                 self.arrow_spawner.spawning_allowed = False
+                gc_manager.end_song()
+                self.timer.dump(self.song_key, self.difficulty)
                 return
 
-        # Update arrow positions and check for misses
-        for arrow in list(self.arrow_group.sprites()):  # Create a copy of the sprite list
-            # Reverse direction in gravity mode
-            speed = -self.arrow_speed if self.gravity_mode else self.arrow_speed
-            arrow.update(speed)
-            
-            # Check if arrow has passed the hit zone
-            outline = next((o for o in self.outline_group if o.key == arrow.key), None)
-            if outline:
-                if self.gravity_mode:
-                    if arrow.rect.bottom < outline.rect.top:
-                        self.hit_detector.check_miss(arrow)
-                        arrow.kill()  # This will remove the sprite from all groups
-                else:
-                    if arrow.rect.top > outline.rect.bottom:
-                        self.hit_detector.check_miss(arrow)
-                        arrow.kill()  # This will remove the sprite from all groups
+        # Miss every note whose hit window has closed
+        self.hit_detector.expire(self.notes, elapsed_sec)
 
         # Spawn new arrows
-        self.arrow_spawner.spawn_arrow(elapsed_sec, self.arrow_group, self.gravity_mode)
+        self.timer.start('spawn')
+        self.arrow_spawner.spawn_arrow(elapsed_sec, self.notes, self.gravity_mode)
+        self.timer.stop('spawn')
+
+        # Place arrows for the current song time, reversing direction in gravity mode
+        speed = self.arrow_speed * FPS  # pixels per second
+        velocity = -speed if self.gravity_mode else speed
+        hit_y = self.outline_manager.get_hit_line(self.outline_group)
+        if self.note_engine:
+            self.note_engine.advance(elapsed_sec, hit_y, velocity)
+        else:
+            self.arrow_group.update(elapsed_sec, hit_y, velocity)
 
     def init_results_popup(self):
         # Centered popup with score and 3 buttons
@@ -259,38 +321,21 @@ class Game:
              ]
 
     def draw_results_popup(self):
-        # Dim background
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0,0,0,180))
-        self.display.blit(overlay, (0,0))
-        # Popup box
-        popup_rect = pygame.Rect(WINDOW_WIDTH//2-275, WINDOW_HEIGHT//2-250, 550, 500) # Increased width to 550 and adjusted x for centering
-        pygame.draw.rect(self.display, (40,40,40), popup_rect, border_radius=20)
-        pygame.draw.rect(self.display, (200,200,200), popup_rect, 4, border_radius=20)
-        # Score
-        score_text = self.results_font.render(f"Score: {self.final_score}", True, (255,255,0))
-        score_rect = score_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2-150))
-        self.display.blit(score_text, score_rect)
-        # Buttons
-        mouse_pos = pygame.mouse.get_pos()
-
-
-        # Let's try placing the first button closer to the score
-        button_y_start = WINDOW_HEIGHT//2 - 20 # Adjusted starting position for buttons (moved upwards)
-        button_gap = 100 # Keep existing button gap
-        
-        for i, btn in enumerate(self.results_buttons):
-            # Adjust button vertical position based on the new starting point and gap
-            btn['rect'].center = (WINDOW_WIDTH//2, button_y_start + i * button_gap)
-            btn['hover'] = btn['rect'].collidepoint(mouse_pos)
-            color = (255,0,0) if btn['hover'] else (255,255,255)
-            pygame.draw.rect(self.display, color, btn['rect'], border_radius=10, width=3)
-            label = self.results_small_font.render(btn['label'], True, color)
-            label_rect = label.get_rect(center=btn['rect'].center)
-            self.display.blit(label, label_rect)
-
-    def handle_results_popup_events(self):
-        for event in pygame.event.get():
+        """Draw the results popup, only redrawing buttons whose hover state changed."""
+        if self.results_layer is None:
+            # Let's try placing the first button closer to the score
+            button_y_start = WINDOW_HEIGHT//2 - 20 # Adjusted starting position for buttons (moved upwards)
+            button_gap = 100 # Keep existing button gap
+            for i, btn in enumerate(self.results_buttons):
+                btn['rect'].center = (WINDOW_WIDTH//2, button_y_start + i * button_gap)
+            popup_rect = pygame.Rect(WINDOW_WIDTH//2-275, WINDOW_HEIGHT//2-250, 550, 500) # Increased width to 550 and adjusted x for centering
+            score_text = self.results_font.render(f"Score: {self.final_score}", True, (255,255,0))
+            self.results_layer = PopupLayer(self.last_frame, popup_rect, score_text, (WINDOW_WIDTH//2, WINDOW_HEIGHT//2-150),
+                                            self.results_buttons, self.results_small_font)
+        return self.results_layer.draw(self.display, pygame.mouse.get_pos())
+
+    def handle_results_popup_events(self, events=None):
+        for event in (pygame.event.get() if events is None else events):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -331,23 +376,42 @@ class Game:
                                  # main_menu will be called from menu
                         return # Exit event handling after a button is pressed
 
+    def update_static_layer(self):
+        """Bake the background and outlines into the renderer's static layer."""
+        layer = self.background.copy()
+        self.outline_group.draw(layer)
+        self.renderer.set_background(layer)
+
+    def uses_dirty_rects(self, elapsed_sec):
+        """Check whether this frame can be drawn with dirty rects instead of a full redraw."""
+        if RENDER_MODE != "dirty":
+            return False
+        # A playing video changes the whole window every frame
+        video_playing = self.background_video and self.background_video.active and elapsed_sec >= VIDEO_START_DELAY
+        return not video_playing
+
+    def present(self):
+        """Push the frame to the window, only the changed regions when possible."""
+        self.renderer.present(full=not self.dirty_frame)
+
     def draw(self):
-        # If results popup is showing, blit the last frame and return - only in normal mode
-        if self.mode == "normal" and self.show_results and self.last_frame is not None:
-            self.display.blit(self.last_frame, (0, 0))
-            return
-        # If paused, blit the pause frame and return
-        if self.paused and self.pause_frame is not None:
-            self.display.blit(self.pause_frame, (0, 0))
-            return
+        self.dirty_frame = False
+        # Pause and results screens are drawn by their popup layers
 
         # Get elapsed time
-        elapsed_ms = pygame.time.get_ticks() - self.start_ticks
-        elapsed_sec = elapsed_ms / 1000
+        elapsed_sec = self.clock.now()
+
+        self.dirty_frame = self.uses_dirty_rects(elapsed_sec)
+        blit = self.blit_dirty if self.dirty_frame else self.display.blit
 
         # Draw background video if not paused or showing results and after delay
-        if not self.paused and not self.show_results and self.background_video and elapsed_sec >= VIDEO_START_DELAY:
+        if self.dirty_frame:
+            # Restore the background and outlines under last frame's drawing
+            self.renderer.begin()
+        elif not self.paused and not self.show_results and self.background_video and elapsed_sec >= VIDEO_START_DELAY:
+            self.timer.start('video')
             self.background_video.draw(self.display, (0, 0))
+            self.timer.stop('video')
         elif not self.paused and not self.show_results and elapsed_sec < VIDEO_START_DELAY:
             # Draw black background before video starts
             self.display.fill((0, 0, 0)) # Fill with black
@@ -356,29 +420,36 @@ class Game:
             self.display.blit(self.background, (0, 0))
 
         # Draw score
-        score_text = self.font.render(f"Score: {self.hit_detector.score}", True, (0, 0, 255))
-        self.display.blit(score_text, SCORE_POSITION)
+        self.timer.start('hud')
+        score_text = font_manager.render_number(self.font, self.hit_detector.score, (0, 0, 255), prefix="Score: ")
+        blit(score_text, SCORE_POSITION)
 
         # Draw miss counter
-        miss_text = self.font.render(f"Misses: {self.hit_detector.misses}", True, (0, 0, 255))
-        self.display.blit(miss_text, MISS_POSITION)
+        miss_text = font_manager.render_number(self.font, self.hit_detector.misses, (0, 0, 255), prefix="Misses: ")
+        blit(miss_text, MISS_POSITION)
 
         # Draw combo counter
         if self.hit_detector.combo > 0:
-            combo_text = self.combo_font.render(f"{self.hit_detector.combo} Combo", True, (255, 165, 0))
-            self.display.blit(combo_text, COMBO_POSITION)
+            combo_text = font_manager.render_number(self.combo_font, self.hit_detector.combo, (255, 165, 0), suffix=" Combo")
+            blit(combo_text, COMBO_POSITION)
+        self.timer.stop('hud')
 
-        # Draw game elements
-        self.outline_group.draw(self.display)
-        self.arrow_group.draw(self.display)
+        # Draw game elements, the outlines are already in the static layer for dirty frames
+        if self.dirty_frame:
+            self.renderer.add_all(self.draw_notes())
+        else:
+            self.outline_group.draw(self.display)
+            self.draw_notes()
 
         # Show hit feedback if active
         if self.hit_detector.hit_feedback:
             current_time = pygame.time.get_ticks()
             if current_time - self.hit_detector.hit_feedback_timer < HIT_FEEDBACK_DURATION:
-                feedback_text = self.font.render(self.hit_detector.hit_feedback, True, self.hit_detector.hit_color)
+                self.timer.start('hud')
+                feedback_text = font_manager.render(self.font, self.hit_detector.hit_feedback, self.hit_detector.hit_color)
                 feedback_x = (WINDOW_WIDTH - feedback_text.get_width()) // 2
-                self.display.blit(feedback_text, (feedback_x, FEEDBACK_POSITION[1]))
+                blit(feedback_text, (feedback_x, FEEDBACK_POSITION[1]))
+                self.timer.stop('hud')
 
         # Draw countdown if active
         if self.show_countdown:
@@ -386,19 +457,36 @@ class Game:
             time_left = (self.countdown_duration - (current_time - self.countdown_start)) / 1000
             if time_left > 0:
                 # Draw countdown in top center of screen
-                countdown_text = self.countdown_font.render(f"{int(time_left) + 1}", True, (255, 255, 0))
-                countdown_rect = countdown_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
-                
-                # Draw semi-transparent background for countdown
-                countdown_bg = pygame.Surface((countdown_rect.width + 20, countdown_rect.height + 20), pygame.SRCALPHA)
-                countdown_bg.fill((0, 0, 0, 128))
-                self.display.blit(countdown_bg, (countdown_rect.centerx - countdown_bg.get_width() // 2, 
-                                               countdown_rect.centery - countdown_bg.get_height() // 2))
-                
-                # Draw countdown text
-                self.display.blit(countdown_text, countdown_rect)
-
-        pygame.display.update()
+                countdown_layer = self.get_countdown_layer(int(time_left) + 1)
+                blit(countdown_layer, countdown_layer.get_rect(center=(WINDOW_WIDTH // 2, 50)))
+
+        # Frame timing overlay in the top right corner
+        if self.show_frame_overlay:
+            overlay = self.timer.get_overlay(self.overlay_font)
+            blit(overlay, overlay.get_rect(topright=(WINDOW_WIDTH - 10, 10)))
+
+    def get_countdown_layer(self, number):
+        """Get the countdown number over its semi-transparent backdrop, composed once."""
+        layer = self.countdown_layers.get(number)
+        if layer is None:
+            countdown_text = font_manager.render_number(self.countdown_font, number, (255, 255, 0))
+            layer = pygame.Surface((countdown_text.get_width() + 20, countdown_text.get_height() + 20), pygame.SRCALPHA)
+            layer.fill((0, 0, 0, 128))
+            layer.blit(countdown_text, countdown_text.get_rect(center=layer.get_rect().center))
+            self.countdown_layers[number] = layer
+        return layer
+
+    def blit_dirty(self, source, dest):
+        """Blit to the display and record the area for the next update."""
+        rect = self.display.blit(source, dest)
+        self.renderer.add(rect)
+        return rect
+
+    def draw_notes(self):
+        """Draw the notes and return the rects they cover."""
+        if self.note_engine is not None:
+            return self.note_engine.draw(self.display, True)
+        return self.display.blits([(note.image, note.rect) for note in self.arrow_group])
 
     def cleanup(self):
         """Clean up all game resources."""
@@ -408,7 +496,7 @@ class Game:
         
         # Stop music but don't quit the mixer
         if self.music_started:
-            pygame.mixer.music.stop()
+            audio_manager.stop_music()
             self.music_started = False
         
         # Clean up video resources
@@ -417,6 +505,8 @@ class Game:
             self.background_video = None
         
         # Clear sprite groups
+        self.notes.empty()
+        self.hit_detector.clear_notes()
         self.arrow_group.empty()
         self.outline_group.empty()
         
@@ -429,36 +519,95 @@ class Game:
         self.show_results = False
         self.waiting_for_results = False
         self.paused = False
-        
-        # Force garbage collection
-        import gc
-        gc.collect()
+
+        # Garbage is collected at the next scene change
+        gc_manager.end_song()
+
+    def reset(self):
+        """Rewind to the start of the song for a restart.
+
+        The chart, video decoder, fonts and cached layers stay loaded, only
+        the playback state goes back to how a new Game starts.
+        """
+        if self.music_started:
+            audio_manager.stop_music()
+            self.music_started = False
+        self.music_position = 0
+        self.clock = SongClock(audio_manager)
+
+        # Rewind the notes, the score and the chart cursor
+        self.notes.empty()
+        self.hit_detector.reset()
+        self.arrow_spawner.reset()
+
+        # Hold the video on its first frame until VIDEO_START_DELAY, like on a fresh start
+        if self.background_video:
+            self.background_video.pause()
+            self.background_video.restart()
+
+        # Reset game state
+        self.running = True
+        self.show_results = False
+        self.waiting_for_results = False
+        self.song_end_time = None
+        self.final_time = 0.0
+        self.final_score = 0
+        self.last_frame = None
+        self.results_buttons = []
+        self.results_layer = None
+        self.paused = False
+        self.pause_frame = None
+        self.pause_buttons = []
+        self.pause_layer = None
+        self.next_action = None
+
+        # Back to normal gravity, with a new switch scheduled
+        self.show_countdown = False
+        if self.gravity_mode:
+            self.gravity_mode = False
+            self.outline_manager.update_outline_positions(self.outline_group, self.gravity_mode)
+        if self.difficulty == "medium" or self.difficulty == "hard":
+            self.schedule_next_gravity_switch()
+        self.update_static_layer()
+        self.timer.reset()
+        gc_manager.begin_song()
 
     def pause_game(self):
         if not self.paused:  # Only pause if not already paused
             self.paused = True
-            # Store the current game state
-            self.pause_time = pygame.time.get_ticks() - self.start_ticks
+            # Freeze the song time
+            self.clock.pause()
             # Store current music position
-            if self.music_started and pygame.mixer.music.get_busy():
-                self.music_position = pygame.mixer.music.get_pos() / 1000.0
+            if self.music_started and audio_manager.is_music_playing():
+                self.music_position = self.clock.music_position()
                 audio_manager.pause_music()
+            # Stop the video with the music, so it is neither decoded behind the popup nor ahead after resume
+            if self.background_video:
+                self.background_video.pause()
             # Capture the current frame for pause background
             self.pause_frame = self.display.copy()
             self.init_pause_popup()
+            self.pause_layer = None
+            # Nobody notices a pause while the game is paused
+            gc_manager.collect("pause")
 
     def resume_game(self):
         if self.paused:  # Only resume if currently paused
             self.paused = False
-            # Adjust start_ticks to maintain the same elapsed time
-            self.start_ticks = pygame.time.get_ticks() - self.pause_time
+            # The popup covered the whole window, so redraw everything
+            self.pause_layer = None
+            self.renderer.invalidate()
+            # Continue the song time from where it was paused
+            self.clock.resume()
+            if self.background_video and self.clock.now() >= VIDEO_START_DELAY:
+                self.background_video.resume()
             # Resume music from stored position
             if self.music_started:
                 try:
                     audio_manager.unpause_music()
-                except:
-                    # If unpause fails, try to restart the music
-                    audio_manager.play_music(self.music_path)
+                except pygame.error:
+                    # If unpause fails, restart the music where the song clock left off
+                    audio_manager.play_music(self.music_path, start=self.clock.music_position())
 
     def init_pause_popup(self):
         center_x = WINDOW_WIDTH // 2
@@ -483,34 +632,20 @@ class Game:
         ]
 
     def draw_pause_popup(self):
-        # Dim background
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0,0,0,180))
-        self.display.blit(overlay, (0,0))
-        # Popup box
-        popup_rect = pygame.Rect(WINDOW_WIDTH//2-250, WINDOW_HEIGHT//2-250, 500, 500) # Adjusted position and height
-        pygame.draw.rect(self.display, (40,40,40), popup_rect, border_radius=20)
-        pygame.draw.rect(self.display, (200,200,200), popup_rect, 4, border_radius=20)
-        # Pause text
-        pause_text = self.pause_font.render("PAUSED", True, (255,255,0))
-        pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2-150)) # Adjusted vertical position
-        self.display.blit(pause_text, pause_rect)
-        # Buttons
-        mouse_pos = pygame.mouse.get_pos()
-        button_y_start = WINDOW_HEIGHT//2 - 40 # Adjusted starting position for buttons
-        button_gap = 90 # Keep existing button gap
-        for i, btn in enumerate(self.pause_buttons):
-            # Adjust button vertical position based on the new popup height and arrangement
-            btn['rect'].center = (WINDOW_WIDTH//2, button_y_start + i * button_gap) # Adjust button vertical spacing
-            btn['hover'] = btn['rect'].collidepoint(mouse_pos)
-            color = (255,0,0) if btn['hover'] else (255,255,255)
-            pygame.draw.rect(self.display, color, btn['rect'], border_radius=10, width=3)
-            label = self.pause_small_font.render(btn['label'], True, color)
-            label_rect = label.get_rect(center=btn['rect'].center)
-            self.display.blit(label, label_rect)
-
-    def handle_pause_popup_events(self):
-        for event in pygame.event.get():
+        """Draw the pause popup, only redrawing buttons whose hover state changed."""
+        if self.pause_layer is None:
+            button_y_start = WINDOW_HEIGHT//2 - 40 # Adjusted starting position for buttons
+            button_gap = 90 # Keep existing button gap
+            for i, btn in enumerate(self.pause_buttons):
+                btn['rect'].center = (WINDOW_WIDTH//2, button_y_start + i * button_gap) # Adjust button vertical spacing
+            popup_rect = pygame.Rect(WINDOW_WIDTH//2-250, WINDOW_HEIGHT//2-250, 500, 500) # Adjusted position and height
+            pause_text = self.pause_font.render("PAUSED", True, (255,255,0))
+            self.pause_layer = PopupLayer(self.pause_frame, popup_rect, pause_text, (WINDOW_WIDTH//2, WINDOW_HEIGHT//2-150),
+                                          self.pause_buttons, self.pause_small_font)
+        return self.pause_layer.draw(self.display, pygame.mouse.get_pos())
+
+    def handle_pause_popup_events(self, events=None):
+        for event in (pygame.event.get() if events is None else events):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -549,6 +684,7 @@ class Game:
                 # Switch modes
                 self.gravity_mode = not self.gravity_mode
                 self.outline_manager.update_outline_positions(self.outline_group, self.gravity_mode)
+                self.update_static_layer()
                 self.schedule_next_gravity_switch()
                 self.show_countdown = False
             return
@@ -562,33 +698,50 @@ class Game:
         """Always return True since we're using countdown instead of arrow checks."""
         return True
 
+    def wait_for_events(self):
+        """Sleep until an event arrives (or the idle timeout passes) and return all pending events."""
+        event = pygame.event.wait(IDLE_EVENT_TIMEOUT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def run(self):
         clock = pygame.time.Clock()
         
         while self.running:
             # Only show results popup in normal mode
             if self.mode == "normal" and self.show_results: # Add mode check
-                self.handle_results_popup_events()
-                self.draw()
-                self.draw_results_popup()
-                pygame.display.update()
-                clock.tick(FPS)
+                # Show the popup first, it is static so then sleep until there is input
+                self.renderer.add_all(self.draw_results_popup())
+                self.renderer.present()
+                self.handle_results_popup_events(self.wait_for_events())
                 continue
             # Pause logic applies to both modes
             if self.paused:
-                self.handle_pause_popup_events()
-                self.draw()
-                self.draw_pause_popup()
-                pygame.display.update()
-                clock.tick(FPS)
+                self.renderer.add_all(self.draw_pause_popup())
+                self.renderer.present()
+                self.handle_pause_popup_events(self.wait_for_events())
                 continue
             
+            timer = self.timer
+            timer.start('total')
+            timer.start('events')
             self.handle_events()
+            timer.stop('events')
             # Only update game state if not showing results (which won't happen in endless mode anyway)
             if not self.show_results:
+                timer.start('update')
                 self.update()
+                timer.stop('update')
             
+            timer.start('draw')
             self.draw()
-            pygame.display.update()
+            timer.stop('draw')
+            # The only display update of the frame
+            timer.start('present')
+            self.present()
+            timer.stop('present')
+            timer.stop('total')
+            timer.end_frame()
             clock.tick(FPS)
         return self.next_action # Return the action requested by the user 
\ No newline at end of file
@@ -1,18 +1,25 @@
 from game.constants import (
-    HIT_MARGIN_PERFECT,
-    HIT_MARGIN_GOOD,
-    HIT_MARGIN_LATE,
+    HIT_WINDOW_PERFECT_MS,
+    HIT_WINDOW_GOOD_MS,
+    HIT_WINDOW_LATE_MS,
     SCORE_PERFECT,
     SCORE_GOOD,
     SCORE_LATE,
-    SCORE_MISS
+    SCORE_MISS,
+    LANE_KEYS
 )
 import pygame
+from collections import deque
 from Utility.audio_manager import audio_manager
-import time
 
 class HitDetector:
     def __init__(self):
+        # Judgeable (note_time, note) pairs per lane, in chart order
+        self.lanes = {key: deque() for key in LANE_KEYS}
+        self.reset()
+
+    def reset(self):
+        """Clear the score, combo and queued notes for a new play of the song."""
         self.score = 0
         self.hit_feedback = ""
         self.hit_feedback_timer = 0
@@ -27,64 +34,55 @@ class HitDetector:
         # Buffer for recent key presses to prevent duplicate processing
         self.last_key_press_time = {}
         self.key_cooldown = 0.05  # 50ms cooldown between key presses
+        self.clear_notes()
 
-    def check_hit(self, key, arrow_group, outline_group):
-        """Process a key press and check for hits."""
-        current_time = time.time()
-        
+    def track(self, key, note_time, note):
+        """Queue a newly spawned note on its lane."""
+        self.lanes[key].append((note_time, note))
+
+    def clear_notes(self):
+        """Forget every queued note, e.g. when the note store is emptied."""
+        for lane in self.lanes.values():
+            lane.clear()
+
+    def check_hit(self, key, arrow_group, press_time):
+        """Judge a key press against the next note in its lane.
+
+        press_time is the song time of the key event in seconds, so the
+        result does not depend on which frame handled the event.
+        """
         # Check if this key was pressed too recently
         if key in self.last_key_press_time:
-            if current_time - self.last_key_press_time[key] < self.key_cooldown:
+            if press_time - self.last_key_press_time[key] < self.key_cooldown:
                 return
         
         # Update last key press time
-        self.last_key_press_time[key] = current_time
-        
-        # Find possible hits for this key
-        possible_hits = [arrow for arrow in arrow_group if arrow.key == key]
-        if not possible_hits:
-            self._handle_miss()
-            return
-        
-        # Find outline for this key
-        outline_sprite = next((o for o in outline_group if o.key == key), None)
-        if not outline_sprite:
-            self._handle_miss()
-            return
-        
-        # Sort arrows by distance to outline center y
-        possible_hits.sort(key=lambda a: abs(a.hitbox.centery - outline_sprite.rect.centery))
-        closest_arrow = possible_hits[0]
-        
-        # Check if hitboxes overlap horizontally
-        if not (closest_arrow.hitbox.right >= outline_sprite.rect.left and 
-                closest_arrow.hitbox.left <= outline_sprite.rect.right):
+        self.last_key_press_time[key] = press_time
+
+        # Notes whose window closed before the press are misses, even if update() has not expired them yet
+        lane = self.lanes[key]
+        self._expire_lane(lane, arrow_group, press_time - HIT_WINDOW_LATE_MS / 1000)
+
+        # Only the head of the lane can be judged
+        if not lane:
             self._handle_miss()
             return
-        
-        # Calculate vertical overlap
-        vertical_overlap = min(closest_arrow.hitbox.bottom, outline_sprite.rect.bottom) - max(closest_arrow.hitbox.top, outline_sprite.rect.top)
-        if vertical_overlap <= 0:
+        note_time, closest_arrow = lane[0]
+
+        # Positive offsets are late presses, negative ones are early
+        offset_ms = (press_time - note_time) * 1000
+        distance_ms = abs(offset_ms)
+        if distance_ms > HIT_WINDOW_LATE_MS:
             self._handle_miss()
             return
-        
-        # Calculate center distance and determine if hit is early or late
-        center_dist = abs(closest_arrow.hitbox.centery - outline_sprite.rect.centery)
-        is_late = closest_arrow.hitbox.centery > outline_sprite.rect.centery
-        
-        # Check if arrow is within the outline's vertical bounds
-        is_within_outline = (closest_arrow.hitbox.bottom >= outline_sprite.rect.top and 
-                           closest_arrow.hitbox.top <= outline_sprite.rect.bottom)
-        
-        # Determine hit type based on timing and position
-        if center_dist <= HIT_MARGIN_PERFECT:
+
+        lane.popleft()
+        if distance_ms <= HIT_WINDOW_PERFECT_MS:
             self._handle_hit("Perfect", SCORE_PERFECT, (0, 255, 0), 'perfect', arrow_group, closest_arrow)
-        elif center_dist <= HIT_MARGIN_GOOD:
+        elif distance_ms <= HIT_WINDOW_GOOD_MS:
             self._handle_hit("Good", SCORE_GOOD, (255, 255, 0), 'good', arrow_group, closest_arrow)
-        elif is_within_outline and center_dist <= HIT_MARGIN_LATE:
-            self._handle_hit("Late" if is_late else "Early", SCORE_LATE, (255, 0, 0), 'good', arrow_group, closest_arrow)
         else:
-            self._handle_miss()
+            self._handle_hit("Late" if offset_ms > 0 else "Early", SCORE_LATE, (255, 0, 0), 'good', arrow_group, closest_arrow)
 
     def _handle_hit(self, hit_type, base_score, color, sound, arrow_group, arrow):
         """Handle a successful hit."""
@@ -114,6 +112,20 @@ class HitDetector:
         """Handle a miss when an arrow passes the hit zone."""
         self._handle_miss()
 
+    def expire(self, arrow_group, song_time):
+        """Pop and miss every lane head whose hit window has closed."""
+        deadline = song_time - HIT_WINDOW_LATE_MS / 1000
+        for lane in self.lanes.values():
+            self._expire_lane(lane, arrow_group, deadline)
+
+    def _expire_lane(self, lane, arrow_group, deadline):
+        """Pop and miss the notes at the head of a lane that are older than deadline."""
+        while lane and lane[0][0] < deadline:
+            _, arrow = lane.popleft()
+            if arrow in arrow_group:
+                arrow_group.remove(arrow)
+            self.check_miss(arrow)
+
     def cleanup(self):
         """Clean up resources when the game ends."""
         pass  # No cleanup needed anymore
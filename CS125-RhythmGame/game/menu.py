@@ -2,13 +2,23 @@ import pygame
 import sys
 import os
 from Utility.font_manager import font_manager
-from game.game import Game
+from game.game import Game, PROFILE_KEY
+from game.constants import IDLE_EVENT_TIMEOUT_MS
+from Utility.gc_manager import gc_manager
+from Utility.profiler import profiler
 from assets import outlines, arrows
 
 # Constants
 SCREEN_WIDTH = 1600
 SCREEN_HEIGHT = 900
 SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# Menus redraw on input only, and never more often than this
+MENU_FPS = 30
+# Game action that restarts the song in each mode
+RESTART_ACTIONS = {
+    "normal": 'restart',
+    "endless": 'restart_endless'
+}
 
 # UI Constants
 COLORS = {
@@ -111,32 +121,60 @@ class Button:
                  button_width = max_width + 2 * padding_x
                  button_height = total_height + 2 * padding_y
 
-            self.image = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-            
-            # Draw the button shape (a simple rounded rectangle for a start)
-            button_color = (50, 50, 50, 180) # Dark gray with some transparency
-            border_color = (200, 200, 200) # Light gray border
-            border_width = 3
-            border_radius = 10
-            
-            # Draw the filled rectangle
-            pygame.draw.rect(self.image, button_color, (0, 0, button_width, button_height), border_radius=border_radius)
-            # Draw the border
-            pygame.draw.rect(self.image, border_color, (0, 0, button_width, button_height), border_width, border_radius=border_radius)
-
-            # Blit the text onto the button image (handle multiple lines)
-            lines = self.text_input.split('\n')
-            current_y = (button_height - sum(self.font.render(line, True, self.base_color).get_height() for line in lines)) // 2
-            for line in lines:
-                line_surface = self.font.render(line, True, self.base_color)
-                line_rect = line_surface.get_rect(center=(button_width // 2, current_y + line_surface.get_height() // 2))
-                self.image.blit(line_surface, line_rect)
-                current_y += line_surface.get_height()
+            self.size = (button_width, button_height)
+            self.drawn = True
+        else:
+            self.size = self.image.get_size()
+            self.drawn = False
 
+        # Normal and hover images, each rendered on first use and kept until the text changes
+        self.images = [None, None]
+        self.image = self.get_image()
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))
         # We don't need a separate text_rect anymore as text is part of the image
         # self.text_rect = self.text.get_rect(center=self.rect.center) # Keep for consistency if needed elsewhere, but text is drawn on image
 
+    def render_image(self, hovering):
+        """Draw the button background, border and text for one hover state."""
+        button_width, button_height = self.size
+        image = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
+
+        button_color = (50, 50, 50, 180) # Dark gray with some transparency
+        border_color = (255, 0, 0) if hovering else (200, 200, 200) # Red border on hover, light gray otherwise
+        border_width = 3
+        border_radius = 10
+        text_color = self.hovering_color if hovering else self.base_color
+
+        # Draw the filled rectangle
+        pygame.draw.rect(image, button_color, (0, 0, button_width, button_height), border_radius=border_radius)
+        # Draw the border
+        pygame.draw.rect(image, border_color, (0, 0, button_width, button_height), border_width, border_radius=border_radius)
+
+        # Blit the text onto the button image (handle multiple lines)
+        line_surfaces = [self.font.render(line, True, text_color) for line in self.text_input.split('\n')]
+        current_y = (button_height - sum(line_surface.get_height() for line_surface in line_surfaces)) // 2
+        for line_surface in line_surfaces:
+            line_rect = line_surface.get_rect(center=(button_width // 2, current_y + line_surface.get_height() // 2))
+            image.blit(line_surface, line_rect)
+            current_y += line_surface.get_height()
+        return image
+
+    def get_image(self):
+        """Get the image for the current hover state, rendering it if needed."""
+        if not self.drawn:
+            return self.image
+        if self.images[self.is_hovering] is None:
+            self.images[self.is_hovering] = self.render_image(self.is_hovering)
+        return self.images[self.is_hovering]
+
+    def set_text(self, text_input):
+        """Change the button text, re-rendering its images only if the text differs."""
+        if text_input == self.text_input:
+            return
+        self.text_input = text_input
+        self.images = [None, None]
+        self.image = self.get_image()
+
     # The update method remains the same as it blits the button's surface (self.image)
     def update(self, screen):
         screen.blit(self.image, self.rect)
@@ -144,40 +182,15 @@ class Button:
         # screen.blit(self.text, self.text_rect)
 
     def checkForInput(self, position):
-        if position[0] in range(self.rect.left, self.rect.right) and position[1] in range(self.rect.top, self.rect.bottom):
-            return True
-        return False
+        return self.rect.collidepoint(position)
 
-    # Modify changeColor to update the appearance of the drawn button
+    # Swap in the pre-rendered image for the new hover state
     def changeColor(self, position):
-        is_now_hovering = position[0] in range(self.rect.left, self.rect.right) and position[1] in range(self.rect.top, self.rect.bottom)
+        is_now_hovering = bool(self.rect.collidepoint(position))
 
         if is_now_hovering != self.is_hovering:
             self.is_hovering = is_now_hovering
-            # Re-render the button image with the appropriate text color
-            text_color = self.hovering_color if self.is_hovering else self.base_color
-
-            # Redraw the button background and border using potentially fixed size
-            button_width, button_height = self.image.get_size()
-
-            self.image = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-            
-            button_color = (50, 50, 50, 180) # Dark gray with some transparency
-            border_color = (255, 0, 0) if self.is_hovering else (200, 200, 200) # Red border on hover, light gray otherwise
-            border_width = 3
-            border_radius = 10
-
-            pygame.draw.rect(self.image, button_color, (0, 0, button_width, button_height), border_radius=border_radius)
-            pygame.draw.rect(self.image, border_color, (0, 0, button_width, button_height), border_width, border_radius=border_radius)
-
-            # Blit the text onto the button image (handle multiple lines)
-            lines = self.text_input.split('\n')
-            current_y = (button_height - sum(self.font.render(line, True, self.base_color).get_height() for line in lines)) // 2
-            for line in lines:
-                line_surface = self.font.render(line, True, text_color)
-                line_rect = line_surface.get_rect(center=(button_width // 2, current_y + line_surface.get_height() // 2))
-                self.image.blit(line_surface, line_rect)
-                current_y += line_surface.get_height()
+            self.image = self.get_image()
 
     # Keep the original changeColor logic as a reference if needed
     # def changeColor(self, position):
@@ -190,6 +203,38 @@ class Button:
     #             self.text = self.font.render(self.text_input, True, self.base_color)
     #             self.is_hovering = False
 
+def wait_for_menu_events(clock):
+    """Sleep until there is input and return all pending events.
+
+    Returns an empty list if nothing happened within IDLE_EVENT_TIMEOUT_MS,
+    so the menu still redraws now and then. Redraws are capped at MENU_FPS
+    so a moving mouse cannot make a menu spin.
+    """
+    clock.tick(MENU_FPS)
+    event = pygame.event.wait(IDLE_EVENT_TIMEOUT_MS)
+    if event.type == pygame.NOEVENT:
+        return []
+    events = [event] + pygame.event.get()
+    for event in events:
+        if event.type == pygame.KEYDOWN and event.key == PROFILE_KEY:
+            profiler.start("menu")
+    return events
+
+def run_scenes(scene, *args):
+    """Run the menus and the game from one flat loop.
+
+    A scene is a function that returns the next scene as a tuple of the
+    function and its arguments, or None to stop. Scenes never call each
+    other, so a finished scene (and a finished Game) is released before the
+    next one starts instead of staying on the stack.
+    """
+    next_scene = (scene, *args)
+    while next_scene is not None:
+        scene, *args = next_scene
+        # The last scene's garbage goes now, while nothing is moving
+        gc_manager.collect("scene change")
+        next_scene = scene(*args)
+
 def start_game(song_key, difficulty, mode="normal"):
     """Start the rhythm game with selected song, difficulty, and mode."""
     # Initialize pygame mixer if not already initialized
@@ -198,30 +243,24 @@ def start_game(song_key, difficulty, mode="normal"):
         
     game = Game(outlines, arrows, SONGS, song_key, difficulty, mode)
     next_action = game.run()
+
+    # Restarts rewind the same game instead of loading everything again
+    restart_action = RESTART_ACTIONS.get(mode)
+    while next_action == restart_action:
+        game.reset()
+        next_action = game.run()
     
     # Clean up resources before any navigation
     game.cleanup()
     
     # After game ends, navigate based on the returned action
     if mode == "normal":
-        if next_action == 'restart':
-            # Small delay to ensure resources are properly cleaned up
-            pygame.time.wait(100)
-            start_game(song_key, difficulty, mode) # Restart the same game
-        elif next_action == 'difficulty_select':
-            pattern_selection(song_key) # Go back to difficulty selection for the same song
+        if next_action == 'difficulty_select':
+            return (pattern_selection, song_key) # Go back to difficulty selection for the same song
         else: # Covers 'quit' or None (window close)
-            main_menu() # Go back to the main menu
+            return (main_menu,) # Go back to the main menu
     elif mode == "endless":
-        if next_action == 'restart_endless':
-            # Small delay to ensure resources are properly cleaned up
-            pygame.time.wait(100)
-            start_game(song_key, difficulty, mode) # Restart endless mode with same song
-        else: # Covers 'quit' or None (window close)
-            main_menu() # Go back to the main menu
-    
-    # The return in the menu functions will handle actually returning to the game loop
-    # return # No longer needed as menu functions handle navigation
+        return (main_menu,) # Covers 'quit' or None (window close)
 
 def song_selection_menu():
     """Song selection screen."""
@@ -238,8 +277,7 @@ def song_selection_menu():
     if not songs_list:
         print("[ERROR] No songs found in SONGS dictionary.")
         # Optionally, return to main menu or display an error message
-        main_menu()
-        return
+        return (main_menu,)
 
     # Scrolling state variable
     current_song_index = 0
@@ -301,6 +339,8 @@ def song_selection_menu():
         height=80
     )
 
+    clock = pygame.time.Clock()
+    events = []
     while True:
         mouse_pos = pygame.mouse.get_pos()
         SCREEN.fill(COLORS["BLACK"])
@@ -309,14 +349,11 @@ def song_selection_menu():
         current_song = songs_list[current_song_index]
 
         # Display the consistent menu title
-        title_text = font_manager.get_font(100).render("SELECT SONG", True, COLORS["GOLD"])
+        title_text = font_manager.render(font_manager.get_font(100), "SELECT SONG", COLORS["GOLD"])
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 100))
         SCREEN.blit(title_text, title_rect)
 
-        # Update the text of the single song button
-        song_button.text_input = f"{current_song['title'].upper()}\n{current_song['artist'].upper()}"
-        # Re-render the song button to update its text and appearance
-        song_button.changeColor(mouse_pos) # This also handles hover color change
+        song_button.changeColor(mouse_pos) # Swaps in the pre-rendered hover image
         song_button.update(SCREEN)
 
         # Update and draw scroll buttons conditionally
@@ -332,7 +369,7 @@ def song_selection_menu():
         back_button.changeColor(mouse_pos)
         back_button.update(SCREEN)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -340,46 +377,28 @@ def song_selection_menu():
                 # Check scroll button input only if visible
                 if current_song_index > 0 and up_arrow_button.checkForInput(mouse_pos):
                     current_song_index -= 1
-                    # Force re-render of the song button with new text (combined title and artist)
+                    # Only the song button text changes, its images are re-rendered on demand
                     current_song = songs_list[current_song_index]
-                    song_button = Button(
-                        image=None,
-                        pos=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2), # Maintain centered position
-                        text_input=f"{current_song['title'].upper()}\n{current_song['artist'].upper()}",
-                        font_size=40, # Adjusted font size
-                        base_color=COLORS["WHITE"],
-                        hovering_color=COLORS["RED"],
-                        width=song_button_width,
-                        height=song_button_height
-                    )
+                    song_button.set_text(f"{current_song['title'].upper()}\n{current_song['artist'].upper()}")
                 
                 if current_song_index < len(songs_list) - 1 and down_arrow_button.checkForInput(mouse_pos):
                     current_song_index += 1
-                    # Force re-render of the song button with new text (combined title and artist)
+                    # Only the song button text changes, its images are re-rendered on demand
                     current_song = songs_list[current_song_index]
-                    song_button = Button(
-                        image=None,
-                        pos=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2), # Maintain centered position
-                        text_input=f"{current_song['title'].upper()}\n{current_song['artist'].upper()}",
-                        font_size=40, # Adjusted font size
-                        base_color=COLORS["WHITE"],
-                        hovering_color=COLORS["RED"],
-                        width=song_button_width,
-                        height=song_button_height
-                    )
+                    song_button.set_text(f"{current_song['title'].upper()}\n{current_song['artist'].upper()}")
 
                 # Check the single song button input
                 if song_button.checkForInput(mouse_pos):
                     selected_song_key = songs_list[current_song_index]["key"]
-                    pattern_selection(selected_song_key)
-                    return
+                    return (pattern_selection, selected_song_key)
 
                 # Check back button input
                 if back_button.checkForInput(mouse_pos):
-                    main_menu()
-                    return
+                    return (main_menu,)
 
         pygame.display.update()
+        # Nothing animates here, so sleep until there is input
+        events = wait_for_menu_events(clock)
 
 def pattern_selection(selected_song):
     """Difficulty selection screen."""
@@ -436,6 +455,8 @@ def pattern_selection(selected_song):
         height=button_height # Fixed height
     )
 
+    clock = pygame.time.Clock()
+    events = []
     while True:
         mouse_pos = pygame.mouse.get_pos()
         SCREEN.fill(COLORS["BLACK"])
@@ -444,12 +465,12 @@ def pattern_selection(selected_song):
         song = SONGS.get(selected_song, {"title": "Unknown Song", "artist": "Unknown Artist"})
 
         # Draw song title (Header - h1)
-        song_title_text = font_manager.get_font(70).render(song['title'].upper(), True, COLORS["GOLD"])
+        song_title_text = font_manager.render(font_manager.get_font(70), song['title'].upper(), COLORS["GOLD"])
         song_title_rect = song_title_text.get_rect(center=(SCREEN_WIDTH//2, 150))
         SCREEN.blit(song_title_text, song_title_rect)
 
         # Draw difficulty selection text (Subheading - h2)
-        difficulty_text = font_manager.get_font(50).render("SELECT DIFFICULTY", True, COLORS["WHITE"])
+        difficulty_text = font_manager.render(font_manager.get_font(50), "SELECT DIFFICULTY", COLORS["WHITE"])
         difficulty_rect = difficulty_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         SCREEN.blit(difficulty_text, difficulty_rect)
 
@@ -462,25 +483,23 @@ def pattern_selection(selected_song):
         back_button.changeColor(mouse_pos)
         back_button.update(SCREEN)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if difficulty_buttons[0].checkForInput(mouse_pos):
-                    start_game(selected_song, "easy")
-                    return
+                    return (start_game, selected_song, "easy")
                 if difficulty_buttons[1].checkForInput(mouse_pos):
-                    start_game(selected_song, "medium")
-                    return
+                    return (start_game, selected_song, "medium")
                 if difficulty_buttons[2].checkForInput(mouse_pos):
-                    start_game(selected_song, "hard")
-                    return
+                    return (start_game, selected_song, "hard")
                 if back_button.checkForInput(mouse_pos):
-                    song_selection_menu()
-                    return
+                    return (song_selection_menu,)
 
         pygame.display.update()
+        # Nothing animates here, so sleep until there is input
+        events = wait_for_menu_events(clock)
 
 def endless():
     """Endless mode screen."""
@@ -490,39 +509,43 @@ def endless():
     button_height = 90
     button_gap = 30
 
+    # Mode title
+    endless_text = font_manager.get_font(100).render("ENDLESS", True, COLORS["GOLD"])
+    endless_rect = endless_text.get_rect(center=(SCREEN_WIDTH//2, 250))
+
+    # Back button
+    back_button = Button(
+        image=None,
+        pos=(SCREEN_WIDTH//2, 400), # Adjusted position
+        text_input="BACK",
+        font_size=75,
+        base_color=COLORS["WHITE"],
+        hovering_color=COLORS["RED"],
+        width=350, # Fixed width
+        height=button_height # Fixed height
+    )
+
+    clock = pygame.time.Clock()
+    events = []
     while True:
         mouse_pos = pygame.mouse.get_pos()
         SCREEN.fill(COLORS["BLACK"])
-        
-        # Mode title
-        endless_text = font_manager.get_font(100).render("ENDLESS", True, COLORS["GOLD"])
-        endless_rect = endless_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         SCREEN.blit(endless_text, endless_rect)
-        
-        # Back button
-        back_button = Button(
-            image=None,
-            pos=(SCREEN_WIDTH//2, 400), # Adjusted position
-            text_input="BACK",
-            font_size=75,
-            base_color=COLORS["WHITE"],
-            hovering_color=COLORS["RED"],
-            width=350, # Fixed width
-            height=button_height # Fixed height
-        )
 
         back_button.changeColor(mouse_pos)
         back_button.update(SCREEN)
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if back_button.checkForInput(mouse_pos):
-                    main_menu()
+                    return (main_menu,)
         
         pygame.display.update()
+        # Nothing animates here, so sleep until there is input
+        events = wait_for_menu_events(clock)
 
 def main_menu():
     """Main menu screen."""
@@ -533,68 +556,70 @@ def main_menu():
     button_gap = 40
     button_y_start = 350 # Adjusted starting position for fixed height
 
+    # Menu title
+    menu_text = font_manager.get_font(100).render("RHYTHM GAME", True, COLORS["GOLD"])
+    menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH//2, 200))
+
+    # Create buttons with fixed size and adjusted positions
+    play_button = Button(
+        image=None,
+        pos=(SCREEN_WIDTH//2, button_y_start),
+        text_input="PLAY",
+        font_size=75,
+        base_color=COLORS["WHITE"],
+        hovering_color=COLORS["RED"],
+        width=400,
+        height=95
+    )
+    endless_button = Button(
+        image=None,
+        pos=(SCREEN_WIDTH//2, button_y_start + button_height + button_gap),
+        text_input="ENDLESS",
+        font_size=75,
+        base_color=COLORS["WHITE"],
+        hovering_color=COLORS["RED"],
+        width=400,
+        height=95
+    )
+    quit_button = Button(
+        image=None,
+        pos=(SCREEN_WIDTH//2, button_y_start + 2 * (button_height + button_gap)),
+        text_input="QUIT",
+        font_size=75,
+        base_color=COLORS["WHITE"],
+        hovering_color=COLORS["RED"],
+        width=400,
+        height=95
+    )
+
+    clock = pygame.time.Clock()
+    events = []
     while True:
         mouse_pos = pygame.mouse.get_pos()
         SCREEN.fill(COLORS["BLACK"])
-
-        # Menu title
-        menu_text = font_manager.get_font(100).render("RHYTHM GAME", True, COLORS["GOLD"])
-        menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         SCREEN.blit(menu_text, menu_rect)
 
-        # Create buttons with fixed size and adjusted positions
-        play_button = Button(
-            image=None,
-            pos=(SCREEN_WIDTH//2, button_y_start),
-            text_input="PLAY",
-            font_size=75,
-            base_color=COLORS["WHITE"],
-            hovering_color=COLORS["RED"],
-            width=400,
-            height=95
-        )
-        endless_button = Button(
-            image=None,
-            pos=(SCREEN_WIDTH//2, button_y_start + button_height + button_gap),
-            text_input="ENDLESS",
-            font_size=75,
-            base_color=COLORS["WHITE"],
-            hovering_color=COLORS["RED"],
-            width=400,
-            height=95
-        )
-        quit_button = Button(
-            image=None,
-            pos=(SCREEN_WIDTH//2, button_y_start + 2 * (button_height + button_gap)),
-            text_input="QUIT",
-            font_size=75,
-            base_color=COLORS["WHITE"],
-            hovering_color=COLORS["RED"],
-            width=400,
-            height=95
-        )
-
         # Update and draw buttons
         for button in [play_button, endless_button, quit_button]:
             button.changeColor(mouse_pos)
             button.update(SCREEN)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if play_button.checkForInput(mouse_pos):
-                    song_selection_menu()
-                    return
+                    return (song_selection_menu,)
                 if endless_button.checkForInput(mouse_pos):
-                    start_endless_mode_song_selection() # Call the new endless song selection
-                    return
+                    return (start_endless_mode_song_selection,) # Go to the new endless song selection
                 if quit_button.checkForInput(mouse_pos):
                     pygame.quit()
                     sys.exit()
 
         pygame.display.update()
+        # Nothing animates here, so sleep until there is input
+        events = wait_for_menu_events(clock)
 
 def start_endless_mode_song_selection():
     """Song selection screen for Endless Mode."""
@@ -610,12 +635,14 @@ def start_endless_mode_song_selection():
     # Check if there are any songs available
     if not songs_list:
         print("[ERROR] No songs found in SONGS dictionary.")
-        main_menu()
-        return
+        return (main_menu,)
 
     # Scrolling state variable
     current_song_index = 0
-    
+
+    # Get the initial song info for the button
+    initial_song = songs_list[current_song_index]
+
     # Define button dimensions and gap
     song_button_width = 900 # Much wider button for song title
     song_button_height = 200 # Adjusted height
@@ -627,7 +654,7 @@ def start_endless_mode_song_selection():
     song_button = Button(
         image=None,
         pos=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2), # Centered vertically and horizontally
-        text_input="", # Text will be updated dynamically
+        text_input=f"{initial_song['title'].upper()}\n{initial_song['artist'].upper()}", # Combined title and artist
         font_size=40, # Adjusted font size for larger button
         base_color=COLORS["WHITE"],
         hovering_color=COLORS["RED"],
@@ -670,6 +697,8 @@ def start_endless_mode_song_selection():
         height=80
     )
 
+    clock = pygame.time.Clock()
+    events = []
     while True:
         mouse_pos = pygame.mouse.get_pos()
         SCREEN.fill(COLORS["BLACK"])
@@ -678,14 +707,11 @@ def start_endless_mode_song_selection():
         current_song = songs_list[current_song_index]
 
         # Display the consistent menu title
-        title_text = font_manager.get_font(100).render("SELECT SONG", True, COLORS["GOLD"])
+        title_text = font_manager.render(font_manager.get_font(100), "SELECT SONG", COLORS["GOLD"])
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 100))
         SCREEN.blit(title_text, title_rect)
 
-        # Update the text of the single song button
-        song_button.text_input = f"{current_song["title"].upper()}\n{current_song.get("artist", "Unknown Artist").upper()}"
-        # Re-render the song button to update its text and appearance
-        song_button.changeColor(mouse_pos) # This also handles hover color change
+        song_button.changeColor(mouse_pos) # Swaps in the pre-rendered hover image
         song_button.update(SCREEN)
 
         # Update and draw scroll buttons conditionally
@@ -701,7 +727,7 @@ def start_endless_mode_song_selection():
         back_button.changeColor(mouse_pos)
         back_button.update(SCREEN)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -709,44 +735,26 @@ def start_endless_mode_song_selection():
                 # Check scroll button input only if visible
                 if current_song_index > 0 and up_arrow_button.checkForInput(mouse_pos):
                     current_song_index -= 1
-                    # Force re-render of the song button with new text
+                    # Only the song button text changes, its images are re-rendered on demand
                     current_song = songs_list[current_song_index]
-                    song_button = Button(
-                        image=None,
-                        pos=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2), # Maintain centered position
-                        text_input=f"{current_song["title"].upper()}\n{current_song.get("artist", "Unknown Artist").upper()}",
-                        font_size=40, # Adjusted font size
-                        base_color=COLORS["WHITE"],
-                        hovering_color=COLORS["RED"],
-                        width=song_button_width,
-                        height=song_button_height
-                    )
+                    song_button.set_text(f"{current_song['title'].upper()}\n{current_song.get('artist', 'Unknown Artist').upper()}")
                 
                 if current_song_index < len(songs_list) - 1 and down_arrow_button.checkForInput(mouse_pos):
                     current_song_index += 1
-                    # Force re-render of the song button with new text
+                    # Only the song button text changes, its images are re-rendered on demand
                     current_song = songs_list[current_song_index]
-                    song_button = Button(
-                        image=None,
-                        pos=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2), # Maintain centered position
-                        text_input=f"{current_song["title"].upper()}\n{current_song.get("artist", "Unknown Artist").upper()}",
-                        font_size=40, # Adjusted font size
-                        base_color=COLORS["WHITE"],
-                        hovering_color=COLORS["RED"],
-                        width=song_button_width,
-                        height=song_button_height
-                    )
+                    song_button.set_text(f"{current_song['title'].upper()}\n{current_song.get('artist', 'Unknown Artist').upper()}")
 
                 # Check the single song button input
                 if song_button.checkForInput(mouse_pos):
                     selected_song_key = songs_list[current_song_index]["key"]
                     # Start the game in endless mode
-                    start_game(selected_song_key, "endless") # Pass 'endless' as difficulty/mode
-                    return
+                    return (start_game, selected_song_key, "endless") # Pass 'endless' as difficulty/mode
 
                 # Check back button input
                 if back_button.checkForInput(mouse_pos):
-                    main_menu()
-                    return
+                    return (main_menu,)
 
-        pygame.display.update() 
\ No newline at end of file
+        pygame.display.update()
+        # Nothing animates here, so sleep until there is input
+        events = wait_for_menu_events(clock) 
\ No newline at end of file
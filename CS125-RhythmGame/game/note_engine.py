@@ -0,0 +1,90 @@
+import numpy as np
+
+from game.constants import LANE_KEYS, WINDOW_HEIGHT
+from Sprites.tiles import spawn_positions
+
+# Note states
+NOTE_FREE = 0
+NOTE_LIVE = 1
+
+KEY_TO_LANE = {key: lane for lane, key in enumerate(LANE_KEYS)}
+KEY_TO_ARROW = {
+    'd': 'left_arrow',
+    'f': 'down_arrow',
+    'j': 'up_arrow',
+    'k': 'right_arrow'
+}
+
+
+class NoteEngine:
+    """Structure-of-arrays store that places and culls every live note at once.
+
+    Each note is a slot index into parallel NumPy arrays holding its lane,
+    top y position, state and scheduled hit time. Slots are reused once a
+    note is hit or missed, so slot numbers stay stable while a note lives.
+    """
+
+    def __init__(self, arrows, capacity=256):
+        self.images = [arrows[KEY_TO_ARROW[key]] for key in LANE_KEYS]
+        self.lane_x = [spawn_positions[key][0] for key in LANE_KEYS]
+        self.width, self.height = self.images[0].get_size()
+
+        self.lane = np.zeros(capacity, dtype=np.int8)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.state = np.zeros(capacity, dtype=np.uint8)
+        self.hit_time = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.state == NOTE_LIVE))
+
+    def __contains__(self, slot):
+        return 0 <= slot < len(self.state) and self.state[slot] == NOTE_LIVE
+
+    def _grow(self):
+        capacity = len(self.state)
+        self.lane = np.concatenate((self.lane, np.zeros(capacity, dtype=self.lane.dtype)))
+        self.y = np.concatenate((self.y, np.zeros(capacity, dtype=self.y.dtype)))
+        self.state = np.concatenate((self.state, np.zeros(capacity, dtype=self.state.dtype)))
+        self.hit_time = np.concatenate((self.hit_time, np.zeros(capacity, dtype=self.hit_time.dtype)))
+
+    def add_note(self, key, y, note_time):
+        """Add a note for key with its top edge at y and return its slot."""
+        free = np.flatnonzero(self.state == NOTE_FREE)
+        if not len(free):
+            slot = len(self.state)
+            self._grow()
+        else:
+            slot = int(free[0])
+        self.lane[slot] = KEY_TO_LANE[key]
+        self.y[slot] = y
+        self.state[slot] = NOTE_LIVE
+        self.hit_time[slot] = note_time
+        return slot
+
+    def remove(self, slot):
+        """Free the slot of a note that was hit or missed."""
+        self.state[slot] = NOTE_FREE
+
+    def empty(self):
+        """Remove every note."""
+        self.state[:] = NOTE_FREE
+
+    def advance(self, song_time, hit_y, velocity):
+        """Place every live note for song_time.
+
+        A note's center reaches hit_y exactly at its hit time, travelling at
+        velocity pixels per second (negative in gravity mode).
+        """
+        live = self.state == NOTE_LIVE
+        self.y[live] = hit_y - (self.hit_time[live] - song_time) * velocity - self.height / 2
+
+    def visible(self):
+        """Get the slots of live notes that overlap the screen."""
+        return np.flatnonzero((self.state == NOTE_LIVE) & (self.y > -self.height) & (self.y < WINDOW_HEIGHT))
+
+    def draw(self, surface, doreturn=False):
+        """Blit only the notes that are on screen, optionally returning their rects."""
+        slots = self.visible()
+        lanes = self.lane[slots].tolist()
+        ys = self.y[slots].tolist()
+        return surface.blits([(self.images[lane], (self.lane_x[lane], y)) for lane, y in zip(lanes, ys)], doreturn)
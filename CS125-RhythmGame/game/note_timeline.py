@@ -0,0 +1,43 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class NoteTimeline:
+    """Upcoming notes stored as parallel time/lane-mask arrays with a cursor.
+
+    Rows must be sorted by time. Rows sharing a timestamp are kept as separate
+    entries, and the cursor only ever points at the next row still to spawn.
+    """
+
+    def __init__(self, times=(), lane_masks=()):
+        self.times = times if isinstance(times, (array, memoryview)) else array('d', times)
+        self.lane_masks = lane_masks if isinstance(lane_masks, (array, memoryview)) else array('B', lane_masks)
+        self.cursor = 0
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def remaining(self):
+        """Number of rows that have not been spawned yet."""
+        return len(self.times) - self.cursor
+
+    def seek(self, song_time):
+        """Move the cursor to the first row at or after song_time."""
+        self.cursor = bisect_left(self.times, song_time)
+
+    def due(self, current_time, window):
+        """Consume every row inside [current_time, current_time + window].
+
+        Returns the (start, end) index range of the rows to spawn. Rows that
+        are already behind current_time are skipped rather than spawned late.
+        """
+        times = self.times
+        start = self.cursor
+        if start < len(times) and times[start] < current_time:
+            start = bisect_left(times, current_time, start)
+        end = start
+        if end < len(times) and times[end] <= current_time + window:
+            end = bisect_right(times, current_time + window, end)
+        self.cursor = end
+        return start, end
@@ -39,6 +39,12 @@ class OutlineManager:
                 'y': outline.rect.y
             }
 
+    def get_hit_line(self, outline_group):
+        """Get the y coordinate arrows are aimed at, the center of the outlines."""
+        for outline in outline_group:
+            return outline.rect.centery
+        return WINDOW_HEIGHT - HIT_ZONE_EDGE_DISTANCE
+
     def update_outline_positions(self, outline_group, gravity_mode):
         """Update outline positions based on gravity mode."""
         for outline in outline_group:
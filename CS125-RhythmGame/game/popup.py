@@ -0,0 +1,63 @@
+import pygame
+
+POPUP_DIM_COLOR = (0, 0, 0, 180)
+POPUP_FILL_COLOR = (40, 40, 40)
+POPUP_BORDER_COLOR = (200, 200, 200)
+BUTTON_COLOR = (255, 255, 255)
+BUTTON_HOVER_COLOR = (255, 0, 0)
+
+
+class PopupLayer:
+    """A popup drawn over a frozen frame, composed once.
+
+    The frame, the dimming, the box, the title and every button in its normal
+    state are baked into one opaque surface. Each button also gets its hover
+    image up front, so after the first frame only buttons whose hover state
+    changed are redrawn. Buttons are the game's button dicts ('label', 'rect',
+    'hover'), and their 'hover' flags are kept up to date.
+    """
+
+    def __init__(self, frame, box_rect, title, title_center, buttons, font):
+        self.base = frame.convert()
+        overlay = pygame.Surface(self.base.get_size(), pygame.SRCALPHA)
+        overlay.fill(POPUP_DIM_COLOR)
+        self.base.blit(overlay, (0, 0))
+        pygame.draw.rect(self.base, POPUP_FILL_COLOR, box_rect, border_radius=20)
+        pygame.draw.rect(self.base, POPUP_BORDER_COLOR, box_rect, 4, border_radius=20)
+        self.base.blit(title, title.get_rect(center=title_center))
+
+        self.buttons = buttons
+        self.images = []
+        for btn in buttons:
+            normal = self._button_image(btn, font, BUTTON_COLOR)
+            hover = self._button_image(btn, font, BUTTON_HOVER_COLOR)
+            self.images.append((normal, hover))
+        for btn, (normal, hover) in zip(buttons, self.images):
+            self.base.blit(normal, btn['rect'])
+        self.drawn = False
+
+    def _button_image(self, btn, font, color):
+        image = self.base.subsurface(btn['rect']).copy()
+        pygame.draw.rect(image, color, image.get_rect(), border_radius=10, width=3)
+        label = font.render(btn['label'], True, color)
+        image.blit(label, label.get_rect(center=image.get_rect().center))
+        return image
+
+    def draw(self, surface, mouse_pos):
+        """Draw the popup and return the rects that changed."""
+        if not self.drawn:
+            self.drawn = True
+            surface.blit(self.base, (0, 0))
+            for btn, (normal, hover) in zip(self.buttons, self.images):
+                btn['hover'] = bool(btn['rect'].collidepoint(mouse_pos))
+                if btn['hover']:
+                    surface.blit(hover, btn['rect'])
+            return [surface.get_rect()]
+
+        dirty = []
+        for btn, (normal, hover) in zip(self.buttons, self.images):
+            is_hover = bool(btn['rect'].collidepoint(mouse_pos))
+            if is_hover != btn['hover']:
+                btn['hover'] = is_hover
+                dirty.append(surface.blit(hover if is_hover else normal, btn['rect']))
+        return dirty
@@ -1,99 +1,298 @@
-import pygame 
-from pymediainfo import MediaInfo
+import pygame
+import sys
+import threading
+from collections import deque
 from ffpyplayer.player import MediaPlayer
 from os.path import exists, basename, splitext
 from os import strerror
 from errno import ENOENT
+from game.video_proxy import proxy_for
+from Utility.media_index import media_index
+
+# Decoded frames waiting to be shown, older ones are dropped when it is full
+FRAME_RING_SIZE = 3
+# After a seek, frames further than this (seconds) from the target were decoded before it
+SEEK_TOLERANCE = 0.1
+# Stop waiting for the seek target after dropping this many frames, e.g. when it is past the last frame
+SEEK_MAX_DROPPED_FRAMES = 30
+# ffmpeg pixel formats laid out like a 32-bit surface, by its RGB masks (little-endian)
+NATIVE_PIXEL_FORMATS = {
+    (0xff0000, 0x00ff00, 0x0000ff): 'bgr0',
+    (0x0000ff, 0x00ff00, 0xff0000): 'rgb0'
+}
+
+
+def native_pixel_format(surface):
+    """Get the ffmpeg pixel format whose bytes match a surface's pixels, or None."""
+    if surface.get_bytesize() != 4 or sys.byteorder != 'little':
+        return None
+    return NATIVE_PIXEL_FORMATS.get(surface.get_masks()[:3])
 
 
 class Video:
-    def __init__(self, path):
-        self.path = path
-        self.transparency = 128  # Default transparency (0-255, where 0 is fully transparent)
-        
+    def __init__(self, path, transparency=128):
+        # Prefer a pre-transcoded game-resolution proxy (see tools/transcode_videos.py)
+        self.source_path = path
+        self.path = proxy_for(path) or path
+        # Transparency over a black background (0-255, where 0 is fully transparent)
+        self.transparency = max(0, min(255, transparency))
+
         if exists(path):
-            self.video = MediaPlayer(path)
             info = self.get_file_data()
-            
+
             self.duration = info["duration"]
             self.frames = 0
+            self.pts = 0.0  # Presentation time of the newest decoded frame
             self.frame_delay = 1 / info["frame rate"]
             self.size = info["original size"]
+            self.original_size = info["original size"]
             self.image = pygame.Surface((0, 0))
-                        
+            self.paused = False
             self.active = True
+
+            # Frames are decoded on a worker thread, the game thread only picks up the latest
+            self.ring = deque(maxlen=FRAME_RING_SIZE)
+            # Persistent surfaces the decoder writes into, reused in turn
+            self.surfaces = []
+            self.surface_index = 0
+            self.display = pygame.display.get_surface()
+            self.out_fmt = self._native_format()
+            self.copy_bytes_saved = 0
+            self.dropped_frames = 0  # Frames that failed to upload, only the first is logged
+            self.running = False
+            self.decode_thread = None
+            # Set to cut the worker's sleep short when it has to stop or seek
+            self.wake = threading.Event()
+            # Seeks are applied by the worker, the only thread that touches the player while it runs
+            self.seek_requests = deque(maxlen=1)  # Latest (target pts, accurate) not yet applied
+            self.seek_target = None  # Target of the last seek until a frame near it arrives
+            self.seek_dropped = 0
+            self._open()
         else:
             raise FileNotFoundError(ENOENT, strerror(ENOENT), path)
-        
+
+    def _open(self, start=0.0):
+        """Open the decoder and start the worker that fills the frame ring."""
+        # Background videos are silent, so skip decoding their audio track
+        ff_opts = {'an': True}
+        if self.out_fmt:
+            # Decode straight into the display's pixel layout
+            ff_opts['out_fmt'] = self.out_fmt
+        if self.transparency < 255:
+            # Let the decoder darken each frame once, so drawing it is a single opaque blit
+            gain = self.transparency / 255
+            ff_opts['vf'] = [f"colorchannelmixer=rr={gain:.4f}:gg={gain:.4f}:bb={gain:.4f}"]
+        if self.paused:
+            ff_opts['paused'] = True
+        if start > 0:
+            # Seeking a player that has only just been created crashes ffpyplayer, so start it there instead
+            ff_opts['ss'] = start
+        self.video = MediaPlayer(self.path, ff_opts=ff_opts)
+        if self.size != self.original_size:
+            self.video.set_size(self.size[0], self.size[1])
+
+        self.running = True
+        self.decode_thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self.decode_thread.start()
+
+    def _stop(self):
+        """Stop the worker and close the decoder."""
+        self._join_worker()
+        self.video.close_player()
+        self.ring.clear()
+
+    def _join_worker(self):
+        """Wake the worker from any sleep and wait for it to exit."""
+        self.running = False
+        self.wake.set()
+        if self.decode_thread and self.decode_thread.is_alive():
+            self.decode_thread.join(timeout=1.0)
+        self.wake.clear()
+
     def get_file_data(self):
-        info = MediaInfo.parse(self.path).video_tracks[0]
+        # Parsed once per file and kept across sessions
+        info = media_index.video_info(self.path)
+        frame_count = info["frame count"]
+        if frame_count is None:
+            # Not reported by the container, estimate it from the duration
+            frame_count = round(info["duration"] * info["frame rate"])
         return {"path":self.path,
                 "name":splitext(basename(self.path))[0],
-                "frame rate":float(info.frame_rate),
-                "frame count":info.frame_count,
-                "duration":info.duration / 1000,
-                "original size":(info.width, info.height),
-                "original aspect ratio":info.other_display_aspect_ratio[0]}
-                
+                "frame rate":info["frame rate"],
+                "frame count":frame_count,
+                "duration":info["duration"],
+                "original size":tuple(info["size"]),
+                "original aspect ratio":info["aspect ratio"]}
+
     def get_playback_data(self):
         return {"active":self.active,
-                "time":self.video.get_pts(),
+                "time":self.pts,
                 "volume":self.video.get_volume(),
-                "paused":self.video.get_pause(),
-                "size":self.size}
-        
+                "paused":self.paused,
+                "size":self.size,
+                "copy bytes saved":self.copy_bytes_saved,
+                "dropped frames":self.dropped_frames}
+
+    def _native_format(self):
+        probe = pygame.Surface((1, 1), 0, self.display) if self.display else pygame.Surface((1, 1))
+        return native_pixel_format(probe)
+
+    def _next_surface(self, size):
+        """Get the next persistent frame surface, skipping the one on screen."""
+        if not self.surfaces or self.surfaces[0].get_size() != size:
+            # The ring, the frame on screen and the one being written each need a surface
+            count = FRAME_RING_SIZE + 2
+            if self.display:
+                self.surfaces = [pygame.Surface(size, 0, self.display) for _ in range(count)]
+            else:
+                self.surfaces = [pygame.Surface(size) for _ in range(count)]
+            self.surface_index = 0
+        surface = self.surfaces[self.surface_index]
+        if surface is self.image:
+            self.surface_index = (self.surface_index + 1) % len(self.surfaces)
+            surface = self.surfaces[self.surface_index]
+        self.surface_index = (self.surface_index + 1) % len(self.surfaces)
+        return surface
+
+    def _upload(self, img):
+        """Copy a decoded frame into a persistent surface and return it."""
+        size = img.get_size()
+        surface = self._next_surface(size)
+        if self.out_fmt:
+            linesize = img.get_linesizes(keep_align=True)[0]
+            pitch = surface.get_pitch()
+            with memoryview(surface.get_view('0')) as pixels, \
+                    memoryview(img.to_memoryview(keep_align=True)[0]).cast('B') as data:
+                if linesize == pitch:
+                    # Same layout on both sides, so this is one memcpy with no Python objects in between
+                    pixels[:] = data
+                else:
+                    # Rows are padded differently (e.g. 1366 wide), so copy them one at a time
+                    row_bytes = size[0] * 4
+                    for y in range(size[1]):
+                        pixels[y * pitch:y * pitch + row_bytes] = data[y * linesize:y * linesize + row_bytes]
+            # The old path copied every frame into a new RGB bytearray first
+            self.copy_bytes_saved += size[0] * size[1] * 3
+        else:
+            frame = pygame.image.frombuffer(img.to_bytearray()[0], size, "RGB")
+            surface.blit(frame, (0, 0))
+        return surface
+
+    def _apply_seek(self, target, accurate):
+        """Seek the player, on the worker thread."""
+        self.wake.clear()
+        self.video.seek(target, relative=False, accurate=accurate)
+        self.ring.clear()
+        self.seek_target = target
+        self.seek_dropped = 0
+
+    def _decode_loop(self):
+        """Decode frames into the ring, letting the player drop any that are late."""
+        while self.running:
+            if self.seek_requests:
+                self._apply_seek(*self.seek_requests.popleft())
+            if self.paused:
+                self.wake.wait(self.frame_delay)
+                continue
+            frame, val = self.video.get_frame()
+            if val == "eof":
+                self.active = False
+                break
+            if frame is None:
+                # Nothing due yet, val is how long until the next frame (or 'paused')
+                self.wake.wait(val if isinstance(val, float) and val > 0 else 0.005)
+                continue
+            img, pts = frame
+            if self.seek_target is not None:
+                # The player seeks asynchronously, so frames from before the seek can still come out
+                if abs(pts - self.seek_target) > SEEK_TOLERANCE and self.seek_dropped < SEEK_MAX_DROPPED_FRAMES:
+                    self.seek_dropped += 1
+                    continue
+                self.seek_target = None
+            self.pts = pts
+            try:
+                self.ring.append(self._upload(img))
+            except Exception as e:
+                # Skip the frame instead of letting the worker die and freeze the video
+                self.dropped_frames += 1
+                if self.dropped_frames == 1:
+                    print(f"[ERROR] Could not upload a frame of {self.path}: {e}")
+                continue
+            self.frames += 1
+            if val > 0:
+                self.wake.wait(val)
+
     def restart(self):
-        self.video.seek(0, relative=False, accurate=False)
+        """Go back to the first frame, keeping the paused state."""
+        # The worker exits at the end of the video, so restart it with the seek as its first job.
+        # It drops any frame the player still hands out from before the seek.
+        self._join_worker()
+        self.seek_requests.clear()
+        self.seek_requests.append((0.0, False))
+        self.ring.clear()
+        self.image = pygame.Surface((0, 0))
         self.frames = 0
+        self.pts = 0.0
         self.active = True
-        
+        self.running = True
+        self.decode_thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self.decode_thread.start()
+
     def close(self):
-        self.video.close_player()
         self.active = False
-    
+        self._stop()
+
     def set_size(self, size):
+        if tuple(size) == tuple(self.size):
+            # Proxies are already at the game resolution, so skip the rescale
+            return
         self.video.set_size(size[0], size[1])
         self.size = size
-    
+
     def set_volume(self, volume):
         self.video.set_volume(volume)
-    
+
     def seek(self, seek_time, accurate=False):
-        vid_time = self.video.get_pts()
+        """Seek by seek_time seconds, the worker applies it before decoding its next frame."""
+        vid_time = self.pts
         if vid_time + seek_time < self.duration and self.active:
-            self.video.seek(seek_time)
-            if seek_time < 0:
-                while (vid_time + seek_time < self.frames * self.frame_delay):
-                    self.frames -= 1
-            
+            self.seek_requests.append((max(0.0, vid_time + seek_time), accurate))
+            self.wake.set()
+
     def toggle_pause(self):
         self.video.toggle_pause()
-        
+        self.paused = not self.paused
+
+    def pause(self):
+        """Stop decoding until resume(), the worker only polls while paused."""
+        if not self.paused:
+            self.toggle_pause()
+
+    def resume(self):
+        if self.paused:
+            self.toggle_pause()
+
     def update(self):
-        updated = False
-        while self.video.get_pts() > self.frames * self.frame_delay:
-            frame, val = self.video.get_frame()
-            self.frames += 1
-            updated = True
-        if updated:
-            if val == "eof":
-                self.active = False
-            elif frame != None:
-                self.image = pygame.image.frombuffer(frame[0].to_bytearray()[0], frame[0].get_size(), "RGB")
-        return updated
-        
+        """Pick up the newest decoded frame without waiting for the decoder."""
+        if not self.ring:
+            return False
+        latest = self.ring[-1]
+        if latest is self.image:
+            return False
+        self.image = latest
+        return True
+
     def set_transparency(self, value):
         """Set the transparency level of the video (0-255, where 0 is fully transparent)"""
-        self.transparency = max(0, min(255, value))
-        
+        value = max(0, min(255, value))
+        if value != self.transparency:
+            # The dimming is baked into the decoder, so reopen it at the current position
+            self.transparency = value
+            self._stop()
+            self._open(self.pts)
+
     def draw(self, surf, pos, force_draw=True):
         if self.active:
             if self.update() or force_draw:
-                # Create a temporary surface with alpha channel
-                temp_surface = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-                # Blit the video frame onto the temporary surface
-                temp_surface.blit(self.image, (0, 0))
-                # Set the alpha value for the entire surface
-                temp_surface.set_alpha(self.transparency)
-                # Blit the semi-transparent surface onto the main surface
-                surf.blit(temp_surface, pos)
+                # Frames arrive already dimmed over black, so they are drawn opaque
+                surf.blit(self.image, pos)
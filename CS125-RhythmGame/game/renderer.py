@@ -0,0 +1,56 @@
+import pygame
+
+
+class DirtyRenderer:
+    """Draws over a static background layer and pushes only the regions that changed.
+
+    Each frame the areas drawn on the previous frame are restored from the
+    background, the new frame's drawing is recorded with add(), and present()
+    updates the union of both in a single display update. A full frame
+    (e.g. with a video background) is presented with present(full=True).
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.background = pygame.Surface(display.get_size()).convert()
+        self.previous = []  # Rects drawn on the last presented frame
+        self.current = []
+        self.full = True  # The next dirty frame must redraw the whole background
+
+    def set_background(self, background):
+        """Replace the static layer, e.g. after the outlines move."""
+        self.background.blit(background, (0, 0))
+        self.invalidate()
+
+    def invalidate(self):
+        """Redraw and push the whole window on the next frame."""
+        self.full = True
+
+    def begin(self):
+        """Erase last frame's drawing by restoring the background under it."""
+        if self.full:
+            self.display.blit(self.background, (0, 0))
+        else:
+            blit = self.display.blit
+            background = self.background
+            for rect in self.previous:
+                blit(background, rect, rect)
+        self.current = []
+
+    def add(self, rect):
+        """Record a region drawn this frame."""
+        self.current.append(rect)
+
+    def add_all(self, rects):
+        self.current.extend(rects)
+
+    def present(self, full=False):
+        """Push this frame to the window with one display update."""
+        if full or self.full:
+            pygame.display.update()
+            # Whatever comes next has to repaint the background first
+            self.full = full
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import time
+
+from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+PROXY_DIR = os.path.join('cache', 'video')
+MANIFEST_PATH = os.path.join(PROXY_DIR, 'manifest.json')
+PROXY_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
+PROXY_CODEC = 'libx264'
+# Low bitrate and cheap to decode: no B-frames and a keyframe every half second
+PROXY_CODEC_OPTIONS = {'preset': 'veryfast', 'tune': 'fastdecode', 'crf': '28', 'g': '15', 'bf': '0'}
+
+
+def _hash_file(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _manifest_key(path):
+    return os.path.normpath(path).replace(os.sep, '/')
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Load the source video to proxy mapping, or an empty one."""
+    try:
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, manifest_path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def proxy_for(path, manifest=None):
+    """Get the proxy for a source video if it was built from the file as it is now."""
+    manifest = load_manifest() if manifest is None else manifest
+    entry = manifest.get(_manifest_key(path))
+    if not entry:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+        return None
+    proxy_path = os.path.join(PROXY_DIR, entry['proxy'])
+    return proxy_path if os.path.exists(proxy_path) else None
+
+
+def transcode(src_path, dst_path, size=PROXY_SIZE):
+    """Re-encode a video at size with the proxy codec settings, without audio."""
+    from ffpyplayer.player import MediaPlayer
+    from ffpyplayer.writer import MediaWriter
+
+    # Decode as fast as possible instead of in real time, keeping every frame
+    player = MediaPlayer(src_path, ff_opts={'an': True, 'sync': 'ext', 'framedrop': False,
+                                            'out_fmt': 'yuv420p', 'x': size[0], 'y': size[1]})
+    writer = None
+    frames = 0
+    try:
+        while True:
+            frame, val = player.get_frame()
+            if val == 'eof':
+                break
+            if frame is None:
+                time.sleep(0.001)
+                continue
+            img, pts = frame
+            if writer is None:
+                rate_num, rate_den = player.get_metadata()['frame_rate']
+                stream = {'pix_fmt_in': 'yuv420p', 'width_in': size[0], 'height_in': size[1],
+                          'codec': PROXY_CODEC, 'frame_rate': (rate_num, rate_den)}
+                writer = MediaWriter(dst_path, [stream], fmt='mp4', lib_opts=PROXY_CODEC_OPTIONS, overwrite=True)
+            # Constant frame rate output, timed by frame index
+            writer.write_frame(img=img, pts=frames * rate_den / rate_num)
+            frames += 1
+    finally:
+        player.close_player()
+        if writer is not None:
+            writer.close()
+    return frames
+
+
+def build_proxy(path, size=PROXY_SIZE):
+    """Build the proxy for a source video unless one with the same contents exists.
+
+    Proxies are named by the hash of the source file, so renamed or copied
+    videos share one proxy. Returns the manifest entry for the source.
+    """
+    stat = os.stat(path)
+    digest = _hash_file(path)
+    name = f"{digest}-{size[0]}x{size[1]}.mp4"
+    proxy_path = os.path.join(PROXY_DIR, name)
+    if not os.path.exists(proxy_path):
+        os.makedirs(PROXY_DIR, exist_ok=True)
+        start = time.perf_counter()
+        # Unique per process, in case two workers build the same proxy
+        tmp_path = f"{proxy_path}.{os.getpid()}.tmp"
+        frames = transcode(path, tmp_path, size)
+        os.replace(tmp_path, proxy_path)
+        print(f"[DEBUG] Transcoded {path} ({frames} frames) to {proxy_path} in {time.perf_counter() - start:.2f}s")
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': digest, 'proxy': name}
+
+
+def record_proxy(path, entry, manifest):
+    """Point a source video at its proxy in the manifest."""
+    manifest[_manifest_key(path)] = entry
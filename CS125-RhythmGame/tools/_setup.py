@@ -0,0 +1,7 @@
+"""Common setup for the tools, shared with the benchmarks (see benchmarks/_setup.py)."""
+import os
+import runpy
+
+# The project root is not importable yet, so run the shared module by path
+_SHARED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', '_setup.py')
+START_DIR, ROOT = (runpy.run_path(_SHARED)[name] for name in ('START_DIR', 'ROOT'))
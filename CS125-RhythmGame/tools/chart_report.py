@@ -0,0 +1,35 @@
+"""Offline chart statistics. Requires pandas, which the game itself does not need.
+
+Usage: python tools/chart_report.py [path/to/key_log.csv ...]
+"""
+import glob
+import os
+import sys
+
+from _setup import ROOT, START_DIR
+
+from game.chart_reader import read_chart_dataframe
+
+
+def report(csv_path):
+    df = read_chart_dataframe(csv_path)
+    if df.empty:
+        print(f"{csv_path}: no notes")
+        return
+    duration = df['timestamp'].max() - df['timestamp'].min()
+    notes = df['keys'].str.len()
+    print(csv_path)
+    print(f"  rows: {len(df)}  notes: {notes.sum()}  chords: {(notes > 1).sum()}")
+    print(f"  span: {df['timestamp'].min():.2f}s - {df['timestamp'].max():.2f}s")
+    if duration > 0:
+        per_second = df.groupby(df['timestamp'].astype(int))['keys'].apply(lambda keys: keys.str.len().sum())
+        print(f"  notes/sec: mean {notes.sum() / duration:.2f}  peak {per_second.max()}")
+    print(f"  min gap: {df['timestamp'].sort_values().diff().min():.3f}s")
+
+
+if __name__ == "__main__":
+    # Chart paths on the command line are relative to where the tool was started
+    paths = [os.path.join(START_DIR, path) for path in sys.argv[1:]]
+    paths = paths or sorted(glob.glob(os.path.join(ROOT, 'assets', 'songs', '*', 'key_log.csv')))
+    for path in paths:
+        report(path)
@@ -0,0 +1,55 @@
+"""Pre-transcode background videos to game-resolution proxies, one process per core.
+
+Proxies are stored in cache/video under the hash of the source file and
+listed in cache/video/manifest.json, which Video checks before opening a
+source video. Sources whose proxy is already up to date are skipped.
+
+Usage: python tools/transcode_videos.py [-j JOBS] [--force] [path/to/video.mp4 ...]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from _setup import ROOT, START_DIR
+
+from game.video_proxy import build_proxy, load_manifest, proxy_for, record_proxy, save_manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('videos', nargs='*', help="videos to transcode (default: assets/vids/*.mp4)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument('--force', action='store_true', help="rebuild proxies that are already up to date")
+    args = parser.parse_args()
+
+    # Video paths on the command line are relative to where the tool was started
+    videos = [os.path.relpath(os.path.join(START_DIR, path), ROOT) for path in args.videos]
+    videos = videos or sorted(glob.glob(os.path.join('assets', 'vids', '*.mp4')))
+    manifest = load_manifest()
+    pending = [path for path in videos if args.force or proxy_for(path, manifest) is None]
+    print(f"{len(videos)} videos, {len(videos) - len(pending)} up to date, transcoding {len(pending)}")
+    if not pending:
+        return
+
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {pool.submit(build_proxy, path): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                record_proxy(path, future.result(), manifest)
+            except Exception as e:
+                failed += 1
+                print(f"[ERROR] Failed to transcode {path}: {e}")
+    save_manifest(manifest)
+    print(f"Done in {time.perf_counter() - start:.2f}s ({failed} failed)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()